@@ -149,7 +149,7 @@ class Settings(BaseSettings):
 
     class Config:
         case_sensitive = True
-        env_file = ".env"
+        env_file = os.environ.get("APP_ENV_FILE", ".env")
         extra = "ignore"  # Ignore extra fields from .env file
 
 
@@ -5,6 +5,8 @@ from typing import Any
 
 from bson import ObjectId
 
+_NON_DIGIT_RE = re.compile(r"\D")
+
 
 class PyObjectId(ObjectId):
     """Custom ObjectId type for Pydantic models."""
@@ -52,9 +54,9 @@ def validate_phone_number(value: Any) -> str | None:
 
     # Remove all non-digit characters except +
     if value.startswith("+"):
-        phone_digits = re.sub(r"\D", "", value[1:])  # Remove + and non-digits
+        phone_digits = _NON_DIGIT_RE.sub("", value[1:])  # Remove + and non-digits
     else:
-        phone_digits = re.sub(r"\D", "", value)  # Remove all non-digits
+        phone_digits = _NON_DIGIT_RE.sub("", value)  # Remove all non-digits
 
     # Check if it's a valid length (7-15 digits)
     if len(phone_digits) < 7 or len(phone_digits) > 15:
@@ -90,9 +92,9 @@ def validate_required_phone_number(value: Any) -> str:
 
     # Remove all non-digit characters except +
     if value.startswith("+"):
-        phone_digits = re.sub(r"\D", "", value[1:])  # Remove + and non-digits
+        phone_digits = _NON_DIGIT_RE.sub("", value[1:])  # Remove + and non-digits
     else:
-        phone_digits = re.sub(r"\D", "", value)  # Remove all non-digits
+        phone_digits = _NON_DIGIT_RE.sub("", value)  # Remove all non-digits
 
     # Check if it's a valid length (7-15 digits)
     if len(phone_digits) < 7 or len(phone_digits) > 15:
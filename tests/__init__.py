@@ -1 +1,6 @@
 # Tests package
+import os
+
+# Keep a developer's local .env out of the test run; settings are read from
+# .env.test (if present) before app.core.config is first imported.
+os.environ.setdefault("APP_ENV_FILE", ".env.test")
@@ -101,7 +101,6 @@ class TestGetAuthorizationHeader:
 class TestVerifyTokenNotBlocked:
     """Test cases for verify_token_not_blocked function."""
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.get_token_jti")
     @patch("app.core.auth_dependencies.is_token_blocked")
     async def test_verify_token_not_blocked_success(
@@ -118,7 +117,6 @@ class TestVerifyTokenNotBlocked:
         mock_get_jti.assert_called_once_with("valid_token")
         mock_is_blocked.assert_called_once_with("jti_123", mock_database)
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.get_token_jti")
     @patch("app.core.auth_dependencies.is_token_blocked")
     async def test_verify_token_not_blocked_when_blocked(
@@ -132,7 +130,6 @@ class TestVerifyTokenNotBlocked:
         with pytest.raises(UnauthorizedException, match="Token has been revoked"):
             await verify_token_not_blocked("blocked_token", mock_database)
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.get_token_jti")
     async def test_verify_token_not_blocked_with_exception(self, mock_get_jti):
         """Test token verification when get_token_jti raises exception."""
@@ -146,13 +143,11 @@ class TestVerifyTokenNotBlocked:
 class TestGetCurrentUserToken:
     """Test cases for get_current_user_token function."""
 
-    @pytest.mark.asyncio
     async def test_get_current_user_token_with_no_token(self):
         """Test get_current_user_token with no token provided."""
         with pytest.raises(UnauthorizedException, match="Authorization header missing"):
             await get_current_user_token(None, Mock())
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.verify_token_not_blocked")
     @patch("app.core.auth_dependencies.verify_access_token")
     async def test_get_current_user_token_success(
@@ -176,7 +171,6 @@ class TestGetCurrentUserToken:
         assert result.token_type == "access"
         assert isinstance(result.expires_at, datetime)
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.verify_token_not_blocked")
     async def test_get_current_user_token_when_blocked(self, mock_verify_not_blocked):
         """Test get_current_user_token when token is blocked."""
@@ -188,7 +182,6 @@ class TestGetCurrentUserToken:
         with pytest.raises(UnauthorizedException, match="Token has been revoked"):
             await get_current_user_token("blocked_token", mock_database)
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.verify_token_not_blocked")
     @patch("app.core.auth_dependencies.verify_access_token")
     async def test_get_current_user_token_invalid_payload(
@@ -206,7 +199,6 @@ class TestGetCurrentUserToken:
         with pytest.raises(UnauthorizedException, match="Invalid token payload"):
             await get_current_user_token("invalid_payload_token", mock_database)
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.verify_token_not_blocked")
     @patch("app.core.auth_dependencies.verify_access_token")
     async def test_get_current_user_token_with_exception(
@@ -289,14 +281,12 @@ class TestGetAuthStatus:
 class TestGetTokenInfo:
     """Test cases for get_token_info function."""
 
-    @pytest.mark.asyncio
     async def test_get_token_info_with_no_token(self):
         """Test get_token_info with no token provided."""
         result = await get_token_info(None, Mock())
 
         assert result is None
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.verify_token_not_blocked")
     @patch("app.core.auth_dependencies.verify_access_token")
     async def test_get_token_info_success(
@@ -323,7 +313,6 @@ class TestGetTokenInfo:
         assert isinstance(result.expires_at, datetime)
         assert isinstance(result.is_expired, bool)
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.verify_token_not_blocked")
     @patch("app.core.auth_dependencies.verify_access_token")
     async def test_get_token_info_invalid_payload(
@@ -342,7 +331,6 @@ class TestGetTokenInfo:
 
         assert result is None
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.verify_token_not_blocked")
     async def test_get_token_info_when_blocked(self, mock_verify_not_blocked):
         """Test get_token_info when token is blocked."""
@@ -353,7 +341,6 @@ class TestGetTokenInfo:
 
         assert result is None
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.verify_token_not_blocked")
     @patch("app.core.auth_dependencies.verify_access_token")
     async def test_get_token_info_with_exception(
@@ -395,7 +382,6 @@ class TestGetCurrentUserOptional:
 class TestGetCurrentUser:
     """Test cases for get_current_user function."""
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.User")
     async def test_get_current_user_success(self, mock_user_class):
         """Test get_current_user with valid token data."""
@@ -423,7 +409,6 @@ class TestGetCurrentUser:
         assert result == mock_user
         mock_user_class.find_one.assert_called_once()
 
-    @pytest.mark.asyncio
     @patch("app.core.auth_dependencies.User")
     async def test_get_current_user_not_found(self, mock_user_class):
         """Test get_current_user when user is not found."""
@@ -450,7 +435,6 @@ class TestGetCurrentUser:
 class TestRequireAdmin:
     """Test cases for require_admin function."""
 
-    @pytest.mark.asyncio
     async def test_require_admin_success(self):
         """Test require_admin with admin user."""
         mock_user = Mock()
@@ -460,7 +444,6 @@ class TestRequireAdmin:
 
         assert result == mock_user
 
-    @pytest.mark.asyncio
     async def test_require_admin_with_non_admin(self):
         """Test require_admin with non-admin user."""
         mock_user = Mock()
@@ -473,7 +456,6 @@ class TestRequireAdmin:
 class TestRequireOrgAdmin:
     """Test cases for require_org_admin function."""
 
-    @pytest.mark.asyncio
     async def test_require_org_admin_success(self):
         """Test require_org_admin with org_admin user."""
         mock_user = Mock()
@@ -483,7 +465,6 @@ class TestRequireOrgAdmin:
 
         assert result == mock_user
 
-    @pytest.mark.asyncio
     async def test_require_org_admin_with_non_org_admin(self):
         """Test require_org_admin with non-org_admin user."""
         mock_user = Mock()
@@ -498,7 +479,6 @@ class TestRequireOrgAdmin:
 class TestRequireUserType:
     """Test cases for require_user_type function."""
 
-    @pytest.mark.asyncio
     async def test_require_user_type_success(self):
         """Test require_user_type with allowed user type."""
         mock_user = Mock()
@@ -509,7 +489,6 @@ class TestRequireUserType:
 
         assert result == mock_user
 
-    @pytest.mark.asyncio
     async def test_require_user_type_multiple_allowed(self):
         """Test require_user_type with multiple allowed types."""
         mock_user = Mock()
@@ -520,7 +499,6 @@ class TestRequireUserType:
 
         assert result == mock_user
 
-    @pytest.mark.asyncio
     async def test_require_user_type_not_allowed(self):
         """Test require_user_type with not allowed user type."""
         mock_user = Mock()
@@ -530,7 +508,6 @@ class TestRequireUserType:
         with pytest.raises(AuthorizationException):
             await check_fn(current_user=mock_user)
 
-    @pytest.mark.asyncio
     async def test_require_user_type_no_types_specified(self):
         """Test require_user_type with no types specified (allows all)."""
         mock_user = Mock()
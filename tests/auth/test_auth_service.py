@@ -1,15 +1,35 @@
 """Test cases for authentication service."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, AsyncMock, Mock, patch
 
 import pytest
 from bson import ObjectId
 
 from app.core.exceptions import NotFoundException, UnauthorizedException
-from app.models.user import User
 from app.schemas.auth import LoginRequest, RefreshTokenRequest
+from app.services import auth_service as auth_service_module
 from app.services.auth_service import AuthService
+from app.utils import jwt as jwt_utils
+
+_TEST_OID = ObjectId("507f1f77bcf86cd799439011")
+_TEST_OID_STR = str(_TEST_OID)
+_VALID_LOGIN = LoginRequest(email="test@example.com", password="password123")
+_VALID_REFRESH = RefreshTokenRequest(refresh_token="valid_refresh_token")
+
+
+def _make_user(**overrides):
+    """Create a lightweight stand-in for a User document."""
+    user = SimpleNamespace(
+        id=_TEST_OID,
+        email="test@example.com",
+        password="hashed_password",
+        isActive=True,
+        isVerified=True,
+    )
+    user.__dict__.update(overrides)
+    return user
 
 
 class TestAuthService:
@@ -24,23 +44,17 @@ class TestAuthService:
     @pytest.fixture
     def mock_user(self):
         """Create mock user."""
-        user = Mock(spec=User)
-        user.id = ObjectId("507f1f77bcf86cd799439011")
-        user.email = "test@example.com"
-        user.password = "hashed_password"
-        user.isActive = True
-        user.isVerified = True
-        return user
+        return _make_user()
 
     @pytest.fixture
     def valid_login_request(self):
         """Create valid login request."""
-        return LoginRequest(email="test@example.com", password="password123")
+        return _VALID_LOGIN
 
     @pytest.fixture
     def valid_refresh_request(self):
         """Create valid refresh token request."""
-        return RefreshTokenRequest(refresh_token="valid_refresh_token")
+        return _VALID_REFRESH
 
 
 class TestAuthenticateUser:
@@ -55,17 +69,10 @@ class TestAuthenticateUser:
     @pytest.fixture
     def mock_user(self):
         """Create mock user."""
-        user = Mock(spec=User)
-        user.id = ObjectId("507f1f77bcf86cd799439011")
-        user.email = "test@example.com"
-        user.password = "hashed_password"
-        user.isActive = True
-        user.isVerified = True
-        return user
-
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_email")
-    @patch("app.services.auth_service.verify_password")
+        return _make_user()
+
+    @patch.object(AuthService, "_find_user_by_email")
+    @patch.object(auth_service_module, "verify_password")
     async def test_authenticate_user_success(
         self, mock_verify_password, mock_find_user, auth_service, mock_user
     ):
@@ -80,8 +87,7 @@ class TestAuthenticateUser:
         mock_find_user.assert_called_once_with("test@example.com")
         mock_verify_password.assert_called_once_with("password123", "hashed_password")
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_email")
+    @patch.object(AuthService, "_find_user_by_email")
     async def test_authenticate_user_not_found(self, mock_find_user, auth_service):
         """Test authentication with user not found."""
         mock_find_user.return_value = None
@@ -92,9 +98,8 @@ class TestAuthenticateUser:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_email")
-    @patch("app.services.auth_service.verify_password")
+    @patch.object(AuthService, "_find_user_by_email")
+    @patch.object(auth_service_module, "verify_password")
     async def test_authenticate_user_wrong_password(
         self, mock_verify_password, mock_find_user, auth_service, mock_user
     ):
@@ -108,16 +113,13 @@ class TestAuthenticateUser:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_email")
-    @patch("app.services.auth_service.verify_password")
+    @patch.object(AuthService, "_find_user_by_email")
+    @patch.object(auth_service_module, "verify_password")
     async def test_authenticate_user_inactive(
         self, mock_verify_password, mock_find_user, auth_service
     ):
         """Test authentication with inactive user."""
-        mock_user = Mock(spec=User)
-        mock_user.password = "hashed_password"
-        mock_user.isActive = False
+        mock_user = _make_user(isActive=False)
         mock_find_user.return_value = mock_user
         mock_verify_password.return_value = True
 
@@ -125,8 +127,7 @@ class TestAuthenticateUser:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_email")
+    @patch.object(AuthService, "_find_user_by_email")
     async def test_authenticate_user_exception(self, mock_find_user, auth_service):
         """Test authentication with database exception."""
         mock_find_user.side_effect = Exception("Database error")
@@ -148,49 +149,42 @@ class TestLogin:
     @pytest.fixture
     def mock_user(self):
         """Create mock user."""
-        user = Mock(spec=User)
-        user.id = ObjectId("507f1f77bcf86cd799439011")
-        user.email = "test@example.com"
-        user.password = "hashed_password"
-        user.isActive = True
-        user.isVerified = True
-        return user
+        return _make_user()
 
     @pytest.fixture
     def valid_login_request(self):
         """Create valid login request."""
-        return LoginRequest(email="test@example.com", password="password123")
+        return _VALID_LOGIN
 
-    @pytest.mark.asyncio
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.create_access_token")
-    @patch("app.services.auth_service.create_refresh_token")
-    @patch("app.services.auth_service.AuthService.authenticate_user")
+    @patch.object(AuthService, "authenticate_user")
     async def test_login_success(
         self,
         mock_authenticate,
-        mock_create_refresh,
-        mock_create_access,
         auth_service,
         mock_user,
         valid_login_request,
     ):
         """Test successful login."""
         mock_authenticate.return_value = mock_user
-        mock_create_access.return_value = "access_token_123"
-        mock_create_refresh.return_value = "refresh_token_123"
 
-        result = await auth_service.login(valid_login_request)
+        with patch.multiple(
+            auth_service_module,
+            create_access_token=DEFAULT,
+            create_refresh_token=DEFAULT,
+        ) as mocks:
+            mocks["create_access_token"].return_value = "access_token_123"
+            mocks["create_refresh_token"].return_value = "refresh_token_123"
+
+            result = await auth_service.login(valid_login_request)
 
         assert result.access_token == "access_token_123"
         assert result.refresh_token == "refresh_token_123"
         assert result.token_type == "bearer"
         assert result.expires_in == 900
-        assert result.user_id == str(mock_user.id)
+        assert result.user_id == _TEST_OID_STR
         assert result.email == mock_user.email
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService.authenticate_user")
+    @patch.object(AuthService, "authenticate_user")
     async def test_login_invalid_credentials(
         self, mock_authenticate, auth_service, valid_login_request
     ):
@@ -200,14 +194,12 @@ class TestLogin:
         with pytest.raises(UnauthorizedException, match="Invalid email or password"):
             await auth_service.login(valid_login_request)
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService.authenticate_user")
+    @patch.object(AuthService, "authenticate_user")
     async def test_login_inactive_user(
         self, mock_authenticate, auth_service, valid_login_request
     ):
         """Test login with inactive user."""
-        mock_user = Mock(spec=User)
-        mock_user.isActive = False
+        mock_user = _make_user(isActive=False)
         mock_authenticate.return_value = mock_user
 
         with pytest.raises(UnauthorizedException, match="Account is deactivated"):
@@ -226,16 +218,11 @@ class TestRefreshAccessToken:
     @pytest.fixture
     def mock_user(self):
         """Create mock user."""
-        user = Mock(spec=User)
-        user.id = ObjectId("507f1f77bcf86cd799439011")
-        user.email = "test@example.com"
-        user.isActive = True
-        return user
-
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.create_access_token")
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
-    @patch("app.utils.jwt.verify_refresh_token")
+        return _make_user()
+
+    @patch.object(auth_service_module, "create_access_token")
+    @patch.object(AuthService, "_find_user_by_id")
+    @patch.object(jwt_utils, "verify_refresh_token")
     async def test_refresh_access_token_success(
         self,
         mock_verify_refresh,
@@ -246,7 +233,7 @@ class TestRefreshAccessToken:
     ):
         """Test successful access token refresh."""
         mock_verify_refresh.return_value = {
-            "sub": str(mock_user.id),
+            "sub": _TEST_OID_STR,
             "email": mock_user.email,
         }
         mock_find_user.return_value = mock_user
@@ -258,8 +245,7 @@ class TestRefreshAccessToken:
         assert result.token_type == "bearer"
         assert result.expires_in == 900
 
-    @pytest.mark.asyncio
-    @patch("app.utils.jwt.verify_refresh_token")
+    @patch.object(jwt_utils, "verify_refresh_token")
     async def test_refresh_access_token_invalid_token(
         self, mock_verify_refresh, auth_service
     ):
@@ -269,15 +255,14 @@ class TestRefreshAccessToken:
         with pytest.raises(UnauthorizedException, match="Invalid refresh token"):
             await auth_service.refresh_access_token("invalid_token")
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
-    @patch("app.utils.jwt.verify_refresh_token")
+    @patch.object(AuthService, "_find_user_by_id")
+    @patch.object(jwt_utils, "verify_refresh_token")
     async def test_refresh_access_token_user_not_found(
         self, mock_verify_refresh, mock_find_user, auth_service
     ):
         """Test refresh with user not found."""
         mock_verify_refresh.return_value = {
-            "sub": "507f1f77bcf86cd799439011",
+            "sub": _TEST_OID_STR,
             "email": "test@example.com",
         }
         mock_find_user.return_value = None
@@ -285,17 +270,15 @@ class TestRefreshAccessToken:
         with pytest.raises(UnauthorizedException, match="User not found or inactive"):
             await auth_service.refresh_access_token("valid_token")
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
-    @patch("app.utils.jwt.verify_refresh_token")
+    @patch.object(AuthService, "_find_user_by_id")
+    @patch.object(jwt_utils, "verify_refresh_token")
     async def test_refresh_access_token_inactive_user(
         self, mock_verify_refresh, mock_find_user, auth_service
     ):
         """Test refresh with inactive user."""
-        mock_user = Mock(spec=User)
-        mock_user.isActive = False
+        mock_user = _make_user(isActive=False)
         mock_verify_refresh.return_value = {
-            "sub": "507f1f77bcf86cd799439011",
+            "sub": _TEST_OID_STR,
             "email": "test@example.com",
         }
         mock_find_user.return_value = mock_user
@@ -303,8 +286,7 @@ class TestRefreshAccessToken:
         with pytest.raises(UnauthorizedException, match="User not found or inactive"):
             await auth_service.refresh_access_token("valid_token")
 
-    @pytest.mark.asyncio
-    @patch("app.utils.jwt.verify_refresh_token")
+    @patch.object(jwt_utils, "verify_refresh_token")
     async def test_refresh_access_token_exception(
         self, mock_verify_refresh, auth_service
     ):
@@ -324,61 +306,53 @@ class TestLogout:
         mock_db = Mock()
         return AuthService(mock_db)
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.add_token_to_blocklist")
-    @patch("app.utils.jwt.jwt_manager.get_token_expiry")
-    @patch("app.services.auth_service.get_token_jti")
-    @patch("app.utils.jwt.get_current_user_id")
-    async def test_logout_success(
-        self,
-        mock_get_user_id,
-        mock_get_jti,
-        mock_get_expiry,
-        mock_add_blocklist,
-        auth_service,
-    ):
-        """Test successful logout."""
-        mock_get_user_id.return_value = "507f1f77bcf86cd799439011"
-        mock_get_jti.return_value = "jti_123"
-        mock_get_expiry.return_value = datetime.now(UTC) + timedelta(minutes=15)
-
-        result = await auth_service.logout("access_token_123", "refresh_token_123")
-
-        assert result.message == "Successfully logged out"
-        assert isinstance(result.logged_out_at, datetime)
-        assert mock_add_blocklist.call_count == 2  # Both access and refresh tokens
-
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.add_token_to_blocklist")
-    @patch("app.utils.jwt.jwt_manager.get_token_expiry")
-    @patch("app.services.auth_service.get_token_jti")
-    @patch("app.utils.jwt.get_current_user_id")
-    async def test_logout_without_refresh_token(
-        self,
-        mock_get_user_id,
-        mock_get_jti,
-        mock_get_expiry,
-        mock_add_blocklist,
-        auth_service,
+    @pytest.fixture
+    def logout_mocks(self, monkeypatch):
+        """Patch the token helpers used by logout once per test."""
+        mocks = SimpleNamespace(
+            add_token_to_blocklist=AsyncMock(),
+            get_token_expiry=Mock(
+                return_value=datetime.now(UTC) + timedelta(minutes=15)
+            ),
+            get_token_jti=Mock(return_value="jti_123"),
+            get_current_user_id=Mock(return_value=_TEST_OID_STR),
+        )
+        monkeypatch.setattr(
+            auth_service_module,
+            "add_token_to_blocklist",
+            mocks.add_token_to_blocklist,
+        )
+        monkeypatch.setattr(
+            jwt_utils.jwt_manager, "get_token_expiry", mocks.get_token_expiry
+        )
+        monkeypatch.setattr(auth_service_module, "get_token_jti", mocks.get_token_jti)
+        monkeypatch.setattr(jwt_utils, "get_current_user_id", mocks.get_current_user_id)
+        return mocks
+
+    @pytest.mark.parametrize(
+        "refresh, raises, expected_calls",
+        [
+            ("refresh_token_123", False, 2),  # Both access and refresh tokens
+            (None, False, 1),  # Only access token
+            (None, True, 0),  # Token decoding fails
+        ],
+        ids=["success", "without_refresh_token", "exception"],
+    )
+    async def test_logout(
+        self, auth_service, logout_mocks, refresh, raises, expected_calls
     ):
-        """Test logout without refresh token."""
-        mock_get_user_id.return_value = "507f1f77bcf86cd799439011"
-        mock_get_jti.return_value = "jti_123"
-        mock_get_expiry.return_value = datetime.now(UTC) + timedelta(minutes=15)
+        """Test logout with and without refresh token, and on failure."""
+        if raises:
+            logout_mocks.get_current_user_id.side_effect = Exception("JWT decode error")
+            with pytest.raises(UnauthorizedException, match="Logout failed"):
+                await auth_service.logout("invalid_token", refresh)
+        else:
+            result = await auth_service.logout("access_token_123", refresh)
 
-        result = await auth_service.logout("access_token_123")
+            assert result.message == "Successfully logged out"
+            assert isinstance(result.logged_out_at, datetime)
 
-        assert result.message == "Successfully logged out"
-        assert mock_add_blocklist.call_count == 1  # Only access token
-
-    @pytest.mark.asyncio
-    @patch("app.utils.jwt.get_current_user_id")
-    async def test_logout_exception(self, mock_get_user_id, auth_service):
-        """Test logout with exception."""
-        mock_get_user_id.side_effect = Exception("JWT decode error")
-
-        with pytest.raises(UnauthorizedException, match="Logout failed"):
-            await auth_service.logout("invalid_token")
+        assert logout_mocks.add_token_to_blocklist.call_count == expected_calls
 
 
 class TestChangePassword:
@@ -393,17 +367,11 @@ class TestChangePassword:
     @pytest.fixture
     def mock_user(self):
         """Create mock user."""
-        user = Mock(spec=User)
-        user.id = ObjectId("507f1f77bcf86cd799439011")
-        user.email = "test@example.com"
-        user.password = "hashed_password"
-        user.isActive = True
-        return user
-
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.hash_password")
-    @patch("app.services.auth_service.verify_password")
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
+        return _make_user()
+
+    @patch.object(auth_service_module, "hash_password")
+    @patch.object(auth_service_module, "verify_password")
+    @patch.object(AuthService, "_find_user_by_id")
     async def test_change_password_success(
         self,
         mock_find_user,
@@ -419,27 +387,25 @@ class TestChangePassword:
         mock_user.save = AsyncMock()
 
         result = await auth_service.change_password(
-            "507f1f77bcf86cd799439011", "old_password", "new_password"
+            _TEST_OID_STR, "old_password", "new_password"
         )
 
         assert result is True
         assert mock_user.password == "new_hashed_password"
         mock_user.save.assert_called_once()
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
+    @patch.object(AuthService, "_find_user_by_id")
     async def test_change_password_user_not_found(self, mock_find_user, auth_service):
         """Test password change with user not found."""
         mock_find_user.return_value = None
 
         with pytest.raises(NotFoundException, match="User not found"):
             await auth_service.change_password(
-                "507f1f77bcf86cd799439011", "old_password", "new_password"
+                _TEST_OID_STR, "old_password", "new_password"
             )
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
-    @patch("app.services.auth_service.verify_password")
+    @patch.object(AuthService, "_find_user_by_id")
+    @patch.object(auth_service_module, "verify_password")
     async def test_change_password_wrong_current_password(
         self, mock_verify_password, mock_find_user, auth_service, mock_user
     ):
@@ -451,18 +417,17 @@ class TestChangePassword:
             UnauthorizedException, match="Current password is incorrect"
         ):
             await auth_service.change_password(
-                "507f1f77bcf86cd799439011", "wrong_password", "new_password"
+                _TEST_OID_STR, "wrong_password", "new_password"
             )
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
+    @patch.object(AuthService, "_find_user_by_id")
     async def test_change_password_exception(self, mock_find_user, auth_service):
         """Test password change with exception."""
         mock_find_user.side_effect = Exception("Database error")
 
         with pytest.raises(UnauthorizedException, match="Password change failed"):
             await auth_service.change_password(
-                "507f1f77bcf86cd799439011", "old_password", "new_password"
+                _TEST_OID_STR, "old_password", "new_password"
             )
 
 
@@ -478,27 +443,22 @@ class TestGetUserByToken:
     @pytest.fixture
     def mock_user(self):
         """Create mock user."""
-        user = Mock(spec=User)
-        user.id = ObjectId("507f1f77bcf86cd799439011")
-        user.email = "test@example.com"
-        return user
-
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
-    @patch("app.services.auth_service.get_current_user_id")
+        return _make_user()
+
+    @patch.object(AuthService, "_find_user_by_id")
+    @patch.object(auth_service_module, "get_current_user_id")
     async def test_get_user_by_token_success(
         self, mock_get_user_id, mock_find_user, auth_service, mock_user
     ):
         """Test successful user retrieval by token."""
-        mock_get_user_id.return_value = "507f1f77bcf86cd799439011"
+        mock_get_user_id.return_value = _TEST_OID_STR
         mock_find_user.return_value = mock_user
 
         result = await auth_service.get_user_by_token("valid_token")
 
         assert result == mock_user
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.get_current_user_id")
+    @patch.object(auth_service_module, "get_current_user_id")
     async def test_get_user_by_token_invalid_token(
         self, mock_get_user_id, auth_service
     ):
@@ -509,14 +469,13 @@ class TestGetUserByToken:
 
         assert result is None
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
-    @patch("app.services.auth_service.get_current_user_id")
+    @patch.object(AuthService, "_find_user_by_id")
+    @patch.object(auth_service_module, "get_current_user_id")
     async def test_get_user_by_token_user_not_found(
         self, mock_get_user_id, mock_find_user, auth_service
     ):
         """Test user retrieval when user not found."""
-        mock_get_user_id.return_value = "507f1f77bcf86cd799439011"
+        mock_get_user_id.return_value = _TEST_OID_STR
         mock_find_user.return_value = None
 
         result = await auth_service.get_user_by_token("valid_token")
@@ -536,55 +495,47 @@ class TestValidateUserSession:
     @pytest.fixture
     def mock_user(self):
         """Create mock user."""
-        user = Mock(spec=User)
-        user.id = ObjectId("507f1f77bcf86cd799439011")
-        user.isActive = True
-        return user
+        return _make_user()
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
+    @patch.object(AuthService, "_find_user_by_id")
     async def test_validate_user_session_success(
         self, mock_find_user, auth_service, mock_user
     ):
         """Test successful user session validation."""
         mock_find_user.return_value = mock_user
 
-        result = await auth_service.validate_user_session("507f1f77bcf86cd799439011")
+        result = await auth_service.validate_user_session(_TEST_OID_STR)
 
         assert result is True
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
+    @patch.object(AuthService, "_find_user_by_id")
     async def test_validate_user_session_user_not_found(
         self, mock_find_user, auth_service
     ):
         """Test user session validation with user not found."""
         mock_find_user.return_value = None
 
-        result = await auth_service.validate_user_session("507f1f77bcf86cd799439011")
+        result = await auth_service.validate_user_session(_TEST_OID_STR)
 
         assert result is False
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
+    @patch.object(AuthService, "_find_user_by_id")
     async def test_validate_user_session_inactive_user(
         self, mock_find_user, auth_service
     ):
         """Test user session validation with inactive user."""
-        mock_user = Mock(spec=User)
-        mock_user.isActive = False
+        mock_user = _make_user(isActive=False)
         mock_find_user.return_value = mock_user
 
-        result = await auth_service.validate_user_session("507f1f77bcf86cd799439011")
+        result = await auth_service.validate_user_session(_TEST_OID_STR)
 
         assert result is False
 
-    @pytest.mark.asyncio
-    @patch("app.services.auth_service.AuthService._find_user_by_id")
+    @patch.object(AuthService, "_find_user_by_id")
     async def test_validate_user_session_exception(self, mock_find_user, auth_service):
         """Test user session validation with exception."""
         mock_find_user.side_effect = Exception("Database error")
 
-        result = await auth_service.validate_user_session("507f1f77bcf86cd799439011")
+        result = await auth_service.validate_user_session(_TEST_OID_STR)
 
         assert result is False
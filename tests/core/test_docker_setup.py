@@ -1,67 +1,59 @@
 """
-Test to verify Docker MongoDB setup is working correctly.
+Test the Docker MongoDB setup and the shared test database fixtures.
+
+test_mongodb_connection talks to the container from docker-compose.test.yml
+and only runs with --run-integration; the cleanup test uses the in-process
+fake behind test_db.
 """
 
+import asyncio
+
 import pytest
-from pymongo.errors import ServerSelectionTimeoutError
 
 
-@pytest.mark.asyncio
-async def test_mongodb_connection(test_db):
+@pytest.mark.integration
+async def test_mongodb_connection(container_db):
     """Test that we can connect to the MongoDB container."""
-    # Test basic connection
-    assert test_db is not None
-
-    try:
-        # Test that we can perform operations
-        test_collection = test_db["test_connection"]
+    test_collection = container_db["test_connection"]
 
-        # Insert a test document (async operation)
-        result = await test_collection.insert_one({"test": "data", "value": 123})
-        assert result.inserted_id is not None
+    # Insert a test document (async operation)
+    result = await test_collection.insert_one({"test": "data", "value": 123})
+    assert result.inserted_id is not None
 
-        # Find the document (async operation)
-        document = await test_collection.find_one({"test": "data"})
-        assert document is not None
-        assert document["value"] == 123
+    # Find the document (async operation)
+    document = await test_collection.find_one({"test": "data"})
+    assert document is not None
+    assert document["value"] == 123
 
-        # Clean up (async operation)
-        await test_collection.drop()
 
-    except ServerSelectionTimeoutError:
-        pytest.skip(
-            "MongoDB container is not running. Start with: docker-compose -f docker-compose.test.yml up -d"
-        )
-
-
-@pytest.mark.asyncio
 async def test_database_cleanup(test_db):
-    """Test that database cleanup works properly."""
-    # Clean up any existing data first
+    """Test that database cleanup works properly (in-process fake)."""
     users_collection = test_db["users"]
     searches_collection = test_db["searches"]
     results_collection = test_db["results"]
 
-    # Clear existing data
-    await users_collection.drop()
-    await searches_collection.drop()
-    await results_collection.drop()
+    # Clear any existing data with a single dropDatabase
+    await test_db.client.drop_database(test_db.name)
 
-    # Insert test data (async operations)
-    await users_collection.insert_one({"email": "test@example.com"})
-    await searches_collection.insert_one({"query": "test search"})
-    await results_collection.insert_one({"result": "test result"})
+    # Insert test data concurrently (async operations)
+    await asyncio.gather(
+        users_collection.insert_one({"email": "test@example.com"}),
+        searches_collection.insert_one({"query": "test search"}),
+        results_collection.insert_one({"result": "test result"}),
+    )
 
     # Verify data exists (async operations)
-    user_count = await users_collection.count_documents({})
-    search_count = await searches_collection.count_documents({})
-    result_count = await results_collection.count_documents({})
+    user_count, search_count, result_count = await asyncio.gather(
+        users_collection.count_documents({}),
+        searches_collection.count_documents({}),
+        results_collection.count_documents({}),
+    )
 
     assert user_count == 1
     assert search_count == 1
     assert result_count == 1
 
     # Clean up after test
-    await users_collection.drop()
-    await searches_collection.drop()
-    await results_collection.drop()
+    await test_db.client.drop_database(test_db.name)
+
+    assert await test_db.list_collection_names() == []
@@ -1,13 +1,11 @@
-#!/usr/bin/env python3
 """Test FastAPI exception handler priority."""
 
+import pytest
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from app.core.exceptions import BaseAPIException, ConflictException
 
-app = FastAPI()
-
 
 # Handler 1: Specific ConflictException handler
 async def conflict_specific_handler(
@@ -27,40 +25,36 @@ async def base_api_handler(request: Request, exc: BaseAPIException) -> JSONRespo
     )
 
 
-# Test 1: Only BaseAPIException handler registered
-print("=== Test 1: Only BaseAPIException handler ===")
-app1 = FastAPI()
-app1.add_exception_handler(BaseAPIException, base_api_handler)
+def _resolve(exc, app):
+    """Return the exception type whose handler the app would use for exc."""
+    handlers = app.exception_handlers
+    return next((t for t in type(exc).__mro__ if t in handlers), None)
+
+
+@pytest.fixture(scope="module")
+def apps():
+    """Build one app per handler registration scenario."""
+    # Only BaseAPIException handler registered
+    base_only = FastAPI()
+    base_only.add_exception_handler(BaseAPIException, base_api_handler)
 
-# Simulate handler resolution
-exc = ConflictException("Test conflict")
-print(f"Exception type: {type(exc)}")
-print(f"Exception MRO: {type(exc).__mro__}")
+    # Both handlers registered
+    both = FastAPI()
+    both.add_exception_handler(ConflictException, conflict_specific_handler)
+    both.add_exception_handler(BaseAPIException, base_api_handler)
 
-# Check which handler would be used
-for exc_type in type(exc).__mro__:
-    if exc_type in app1.exception_handlers:
-        print(f"✅ Handler found for: {exc_type.__name__}")
-        break
-    else:
-        print(f"❌ No handler for: {exc_type.__name__}")
+    return {"base_only": base_only, "both": both}
 
-print("\n=== Test 2: Both handlers registered ===")
-app2 = FastAPI()
-app2.add_exception_handler(
-    ConflictException, conflict_specific_handler
-)  # More specific
-app2.add_exception_handler(BaseAPIException, base_api_handler)  # Less specific
 
-# Check which handler would be used
-for exc_type in type(exc).__mro__:
-    if exc_type in app2.exception_handlers:
-        print(f"✅ Handler found for: {exc_type.__name__}")
-        break
-    else:
-        print(f"❌ No handler for: {exc_type.__name__}")
+@pytest.mark.parametrize(
+    "scenario, expected",
+    [
+        ("base_only", BaseAPIException),  # Parent class handler is the fallback
+        ("both", ConflictException),  # Most specific handler wins
+    ],
+)
+def test_handler_priority(apps, scenario, expected):
+    """Test that the most specific registered handler is resolved."""
+    exc = ConflictException("Test conflict")
 
-print("\n=== Handler Priority Summary ===")
-print("1. ConflictException handler (most specific) - wins if registered")
-print("2. BaseAPIException handler (parent class) - used if #1 not found")
-print("3. Exception handler (grandparent) - fallback if #1,#2 not found")
+    assert _resolve(exc, apps[scenario]) is expected
@@ -1,20 +1,83 @@
 """Comprehensive unit tests for user creation, validation, and updates."""
 
+import json
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from bson import ObjectId
-from fastapi.testclient import TestClient
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.core.auth_dependencies import TokenData, get_current_user_token
 from app.core.exceptions import ConflictException, NotFoundException
-from app.main import app
-from app.models.user import User, UserCreate, UserInDB, UserUpdate
+from app.models.user import (
+    User,
+    UserBase,
+    UserCreate,
+    UserInDB,
+    UserType,
+    UserUpdate,
+)
 from app.schemas.user import UserCreateRequest, UserUpdateRequest
 from app.services.user_service import UserService
 from app.utils.validators import validate_phone_number, validate_required_phone_number
+from tests.conftest import TestDataFactory, araise, areturn
+
+# Fixed values for mock data whose exact id/time never matters to assertions
+_STATIC_OID = ObjectId("507f1f77bcf86cd799439011")
+_STATIC_OID_STR = str(_STATIC_OID)
+# Second id for tests that need two distinct users
+_STATIC_OID_2 = ObjectId("507f1f77bcf86cd799439012")
+_STATIC_OID_2_STR = str(_STATIC_OID_2)
+_STATIC_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+# UserCreateRequest payloads and a validator built once for the module
+_VALID_CREATE = {
+    "email": "test@example.com",
+    "phone": "+1234567890",
+    "password": "password123",
+}
+_INVALID_EMAIL_CREATE = {**_VALID_CREATE, "email": "invalid-email"}
+_EMPTY_PHONE_CREATE = {**_VALID_CREATE, "phone": ""}
+_MISSING_PHONE_CREATE = {k: v for k, v in _VALID_CREATE.items() if k != "phone"}
+_CREATE_ADAPTER = TypeAdapter(UserCreateRequest)
+_SHORT_PASSWORD = "12345678"  # 8 characters, the minimum
+_LONG_PASSWORD = "a" * 100  # 100 characters
+
+# Request bodies serialized once for the API tests
+_JSON_HEADERS = {"content-type": "application/json"}
+_VALID_CREATE_BODY = json.dumps(_VALID_CREATE).encode()
+_INVALID_EMAIL_CREATE_BODY = json.dumps(_INVALID_EMAIL_CREATE).encode()
+
+_USER_ATTRS = (
+    "email",
+    "phone",
+    "password",
+    "userType",
+    "features",
+    "isActive",
+    "isVerified",
+    "firstName",
+    "lastName",
+    "address",
+    "city",
+    "pinCode",
+    "state",
+    "organizationId",
+    "orgName",
+    "createdAt",
+    "updatedAt",
+)
+
+
+def _make_user_mock(data):
+    """Create a Mock(spec=User) populated from a user data dict in one call."""
+    mock_user = Mock(spec=User)
+    mock_user.configure_mock(
+        id=ObjectId(data["id"]), **{attr: data.get(attr) for attr in _USER_ATTRS}
+    )
+    return mock_user
 
 
 class TestUserValidation:
@@ -27,22 +90,19 @@ class TestUserValidation:
         assert validate_required_phone_number("1234567890") == "+1234567890"
         assert validate_required_phone_number("+91 98765 43210") == "+919876543210"
 
-        # Invalid cases
-        with pytest.raises(ValueError, match="Phone number is required"):
-            validate_required_phone_number(None)
-
-        with pytest.raises(ValueError, match="Phone number cannot be empty"):
-            validate_required_phone_number("")
-
-        with pytest.raises(
-            ValueError, match="Phone number must be between 7 and 15 digits"
-        ):
-            validate_required_phone_number("123")
-
-        with pytest.raises(
-            ValueError, match="Phone number must be between 7 and 15 digits"
-        ):
-            validate_required_phone_number("12345678901234567890")
+    @pytest.mark.parametrize(
+        "value, message",
+        [
+            (None, "Phone number is required"),
+            ("", "Phone number cannot be empty"),
+            ("123", "Phone number must be between 7 and 15 digits"),
+            ("12345678901234567890", "Phone number must be between 7 and 15 digits"),
+        ],
+    )
+    def test_phone_validation_required_fields_invalid(self, value, message):
+        """Test that invalid required phone numbers are rejected."""
+        with pytest.raises(ValueError, match=message):
+            validate_required_phone_number(value)
 
     def test_phone_validation_optional_fields(self):
         """Test phone validation for optional fields."""
@@ -58,40 +118,24 @@ class TestUserValidation:
     def test_user_create_request_validation(self):
         """Test UserCreateRequest validation."""
         # Valid request
-        valid_request = UserCreateRequest(
-            email="test@example.com",
-            phone="+1234567890",
-            password="password123",
-        )
+        valid_request = _CREATE_ADAPTER.validate_python(_VALID_CREATE)
         assert valid_request.email == "test@example.com"
         assert valid_request.phone == "+1234567890"
         assert valid_request.password == "password123"
 
         # Invalid email
         with pytest.raises(ValidationError) as exc_info:
-            UserCreateRequest(
-                email="invalid-email",
-                phone="+1234567890",
-                password="password123",
-            )
+            _CREATE_ADAPTER.validate_python(_INVALID_EMAIL_CREATE)
         assert "email" in str(exc_info.value)
 
         # Empty phone
         with pytest.raises(ValidationError) as exc_info:
-            UserCreateRequest(
-                email="test@example.com",
-                phone="",
-                password="password123",
-            )
+            _CREATE_ADAPTER.validate_python(_EMPTY_PHONE_CREATE)
         assert "Phone number cannot be empty" in str(exc_info.value)
 
         # Missing required fields
         with pytest.raises(ValidationError):
-            UserCreateRequest(
-                email="test@example.com",
-                # phone missing
-                password="password123",
-            )
+            _CREATE_ADAPTER.validate_python(_MISSING_PHONE_CREATE)
 
     def test_user_update_request_validation(self):
         """Test UserUpdateRequest validation (all fields optional)."""
@@ -126,8 +170,6 @@ class TestUserModel:
 
     def test_user_base_validation(self):
         """Test UserBase model validation."""
-        from app.models.user import UserBase
-
         # Valid user base
         user_base = UserBase(
             email="test@example.com", phone="+1234567890", password="hashed_password"
@@ -157,106 +199,94 @@ class TestUserModel:
         assert user_update.phone == "+9876543210"
         assert user_update.email is None  # Not provided
 
-    def test_user_document_timestamps(self):
+    def test_user_document_timestamps(self, patched_user_settings):
         """Test User document timestamp behavior."""
-        with patch("app.models.user.User.get_settings") as mock_get_settings:
-            mock_settings = MagicMock()
-            mock_settings.pymongo_collection = MagicMock()
-            mock_get_settings.return_value = mock_settings
-
-            # Mock the before_event hook
-            user = User(
-                email="test@example.com",
-                phone="+1234567890",
-                password="hashed_password",
-            )
+        # Mock the before_event hook
+        user = User(
+            email="test@example.com",
+            phone="+1234567890",
+            password="hashed_password",
+        )
 
-            # Test timestamp setting
-            user.set_timestamps()
-            assert user.createdAt is not None
-            assert user.updatedAt is not None
-            assert isinstance(user.createdAt, datetime)
-            assert isinstance(user.updatedAt, datetime)
+        # Test timestamp setting
+        user.set_timestamps()
+        assert user.createdAt is not None
+        assert user.updatedAt is not None
+        assert isinstance(user.createdAt, datetime)
+        assert isinstance(user.updatedAt, datetime)
 
 
 class TestUserService:
     """Test UserService business logic."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Mock database for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_db(cls):
+        """Mock database for testing, shared by the class."""
         return AsyncMock()
 
-    @pytest.fixture
-    def user_service(self, mock_db):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def user_service(cls, mock_db):
         """Create UserService instance with mocked database."""
         return UserService(mock_db)
 
-    @pytest.fixture
-    def test_data_factory(self):
-        """Test data factory fixture."""
-        from tests.conftest import TestDataFactory
-
-        return TestDataFactory()
+    @pytest.fixture(autouse=True)
+    def reset_mock_db(self, mock_db):
+        """Reset the shared mock database's call history before each test."""
+        mock_db.reset_mock()
 
-    @pytest.mark.asyncio
-    async def test_create_user_success(self, user_service, test_data_factory):
+    async def test_create_user_success(
+        self, user_service, patched_user_model, test_data_factory
+    ):
         """Test successful user creation."""
         # Create test data using factory
         user_create_data = test_data_factory.create_user_create_request()
         user_create = UserCreate(**user_create_data)
 
         # Create a mock user instance
-        mock_user = Mock(spec=User)
-        mock_user.id = ObjectId()
-        mock_user.email = user_create_data["email"]
-        mock_user.phone = user_create_data["phone"]
-        mock_user.password = "hashed_password"
-        mock_user.userType = "user"
-        mock_user.features = []
-        mock_user.isActive = True
-        mock_user.isVerified = False
-        mock_user.firstName = None
-        mock_user.lastName = None
-        mock_user.address = None
-        mock_user.city = None
-        mock_user.pinCode = None
-        mock_user.state = None
-        mock_user.organizationId = None
-        mock_user.orgName = None
-        mock_user.createdAt = datetime.now(UTC)
-        mock_user.updatedAt = datetime.now(UTC)
+        mock_user = _make_user_mock(
+            {
+                "id": _STATIC_OID,
+                "email": user_create_data["email"],
+                "phone": user_create_data["phone"],
+                "password": "hashed_password",
+                "userType": "user",
+                "features": [],
+                "isActive": True,
+                "isVerified": False,
+                "createdAt": _STATIC_NOW,
+                "updatedAt": _STATIC_NOW,
+            }
+        )
         mock_user.insert = AsyncMock()
 
         # Mock the User model operations at the service level
-        with patch("app.services.user_service.User") as mock_user_class:
-            # Setup the mock to handle the query pattern: User.email == user.email
-            mock_user_class.email = MagicMock()
-            mock_user_class.email.__eq__ = MagicMock(return_value="query")
-            mock_user_class.find_one = AsyncMock(return_value=None)  # No existing user
-            mock_user_class.return_value = mock_user
-
-            # Mock password hashing
-            with patch(
-                "app.services.user_service.hash_password",
-                return_value="hashed_password",
-            ):
-                result = await user_service.create_user(user_create)
-
-                # Verify Beanie calls
-                mock_user_class.find_one.assert_called_once()
-                mock_user.insert.assert_called_once()
-
-                # Verify result
-                assert isinstance(result, UserInDB)
-                assert result.email == user_create_data["email"]
-                assert result.phone == user_create_data["phone"]
-                assert result.isActive is True  # Should be set to True
-                assert result.isVerified is False  # Should be set to False
-                assert result.password == "hashed_password"
-
-    @pytest.mark.asyncio
-    async def test_create_user_email_conflict(self, user_service, test_data_factory):
+        patched_user_model.find_one.return_value = None  # No existing user
+        patched_user_model.return_value = mock_user
+
+        # Mock password hashing
+        with patch(
+            "app.services.user_service.hash_password",
+            return_value="hashed_password",
+        ):
+            result = await user_service.create_user(user_create)
+
+            # Verify Beanie calls
+            patched_user_model.find_one.assert_called_once()
+            mock_user.insert.assert_called_once()
+
+            # Verify result
+            assert isinstance(result, UserInDB)
+            assert result.email == user_create_data["email"]
+            assert result.phone == user_create_data["phone"]
+            assert result.isActive is True  # Should be set to True
+            assert result.isVerified is False  # Should be set to False
+            assert result.password == "hashed_password"
+
+    async def test_create_user_email_conflict(
+        self, user_service, patched_user_model, test_data_factory
+    ):
         """Test user creation with existing email."""
         # Create test data using factory
         user_create_data = test_data_factory.create_user_create_request()
@@ -266,108 +296,61 @@ class TestUserService:
         mock_existing_user = Mock(spec=User)
         mock_existing_user.email = user_create_data["email"]
 
-        with patch("app.services.user_service.User") as mock_user_class:
-            # Setup mock to handle query pattern
-            mock_user_class.email = MagicMock()
-            mock_user_class.email.__eq__ = MagicMock(return_value="query")
-            mock_user_class.find_one = AsyncMock(return_value=mock_existing_user)
+        patched_user_model.find_one.return_value = mock_existing_user
 
-            with pytest.raises(ConflictException) as exc_info:
-                await user_service.create_user(user_create)
+        with pytest.raises(ConflictException) as exc_info:
+            await user_service.create_user(user_create)
 
-            # Verify Beanie was queried for existing user
-            mock_user_class.find_one.assert_called_once()
+        # Verify Beanie was queried for existing user
+        patched_user_model.find_one.assert_called_once()
 
-            assert "User with this email already exists" in str(exc_info.value)
-            assert exc_info.value.details["email"] == user_create_data["email"]
+        assert "User with this email already exists" in str(exc_info.value)
+        assert exc_info.value.details["email"] == user_create_data["email"]
 
-    @pytest.mark.asyncio
-    async def test_get_user_by_id_success(self, user_service, test_data_factory):
+    async def test_get_user_by_id_success(
+        self, user_service, patched_user_model, test_data_factory
+    ):
         """Test successful user retrieval by ID."""
         # Create test data using factory with valid ObjectId
-        user_id = str(ObjectId())
+        user_id = _STATIC_OID_STR
         mock_user_data = test_data_factory.create_user_data(id=user_id)
 
         # Create a mock user instance
-        mock_user = Mock(spec=User)
-        mock_user.id = ObjectId(mock_user_data["id"])
-        mock_user.email = mock_user_data["email"]
-        mock_user.phone = mock_user_data["phone"]
-        mock_user.password = mock_user_data["password"]
-        mock_user.userType = mock_user_data.get("userType", "user")
-        mock_user.features = mock_user_data.get("features", [])
-        mock_user.isActive = mock_user_data["isActive"]
-        mock_user.isVerified = mock_user_data["isVerified"]
-        mock_user.firstName = mock_user_data.get("firstName")
-        mock_user.lastName = mock_user_data.get("lastName")
-        mock_user.address = mock_user_data.get("address")
-        mock_user.city = mock_user_data.get("city")
-        mock_user.pinCode = mock_user_data.get("pinCode")
-        mock_user.state = mock_user_data.get("state")
-        mock_user.organizationId = mock_user_data.get("organizationId")
-        mock_user.orgName = mock_user_data.get("orgName")
-        mock_user.createdAt = mock_user_data["createdAt"]
-        mock_user.updatedAt = mock_user_data["updatedAt"]
-
-        with patch("app.services.user_service.User") as mock_user_class:
-            # Setup mock to handle query pattern: User.id == ObjectId(user_id)
-            mock_user_class.id = MagicMock()
-            mock_user_class.id.__eq__ = MagicMock(return_value="query")
-            mock_user_class.find_one = AsyncMock(return_value=mock_user)
-
-            result = await user_service.get_user_by_id(mock_user_data["id"])
+        mock_user = _make_user_mock(mock_user_data)
 
-            # Verify Beanie call
-            mock_user_class.find_one.assert_called_once()
+        patched_user_model.find_one.return_value = mock_user
 
-            # Verify result
-            assert result is not None
-            assert result.email == mock_user_data["email"]
+        result = await user_service.get_user_by_id(mock_user_data["id"])
+
+        # Verify Beanie call
+        patched_user_model.find_one.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_get_user_by_id_not_found(self, user_service):
+        # Verify result
+        assert result is not None
+        assert result.email == mock_user_data["email"]
+
+    async def test_get_user_by_id_not_found(self, user_service, patched_user_model):
         """Test user retrieval with non-existent ID."""
-        with patch("app.services.user_service.User") as mock_user_class:
-            # Setup mock to handle query pattern
-            mock_user_class.id = MagicMock()
-            mock_user_class.id.__eq__ = MagicMock(return_value="query")
-            mock_user_class.find_one = AsyncMock(return_value=None)
+        patched_user_model.find_one.return_value = None
 
-            result = await user_service.get_user_by_id("507f1f77bcf86cd799439011")
+        result = await user_service.get_user_by_id(_STATIC_OID_STR)
 
-            # Verify Beanie call
-            mock_user_class.find_one.assert_called_once()
+        # Verify Beanie call
+        patched_user_model.find_one.assert_called_once()
 
-            # Verify result
-            assert result is None
+        # Verify result
+        assert result is None
 
-    @pytest.mark.asyncio
-    async def test_update_user_success(self, user_service, test_data_factory):
+    async def test_update_user_success(
+        self, user_service, patched_user_model, test_data_factory
+    ):
         """Test successful user update."""
         # Create test data using factory with valid ObjectId
-        user_id = str(ObjectId())
+        user_id = _STATIC_OID_STR
         existing_user_data = test_data_factory.create_user_data(id=user_id)
 
         # Create a mock user instance
-        mock_user = Mock(spec=User)
-        mock_user.id = ObjectId(existing_user_data["id"])
-        mock_user.email = existing_user_data["email"]
-        mock_user.phone = existing_user_data["phone"]
-        mock_user.password = existing_user_data["password"]
-        mock_user.userType = existing_user_data.get("userType", "user")
-        mock_user.features = existing_user_data.get("features", [])
-        mock_user.isActive = existing_user_data["isActive"]
-        mock_user.isVerified = existing_user_data["isVerified"]
-        mock_user.firstName = existing_user_data.get("firstName")
-        mock_user.lastName = existing_user_data.get("lastName")
-        mock_user.address = existing_user_data.get("address")
-        mock_user.city = existing_user_data.get("city")
-        mock_user.pinCode = existing_user_data.get("pinCode")
-        mock_user.state = existing_user_data.get("state")
-        mock_user.organizationId = existing_user_data.get("organizationId")
-        mock_user.orgName = existing_user_data.get("orgName")
-        mock_user.createdAt = existing_user_data["createdAt"]
-        mock_user.updatedAt = existing_user_data["updatedAt"]
+        mock_user = _make_user_mock(existing_user_data)
         mock_user.save = AsyncMock()
 
         # Create update request using factory
@@ -376,53 +359,30 @@ class TestUserService:
         )
         user_update = UserUpdate(**update_data)
 
-        with patch("app.services.user_service.User") as mock_user_class:
-            # Setup mock to handle query pattern
-            mock_user_class.id = MagicMock()
-            mock_user_class.id.__eq__ = MagicMock(return_value="query")
-            mock_user_class.find_one = AsyncMock(return_value=mock_user)
+        patched_user_model.find_one.return_value = mock_user
 
-            result = await user_service.update_user(
-                existing_user_data["id"], user_update
-            )
+        result = await user_service.update_user(existing_user_data["id"], user_update)
 
-            # Verify Beanie calls (update may call find_one multiple times)
-            assert mock_user_class.find_one.call_count >= 1
-            mock_user.save.assert_called_once()
+        # Verify Beanie calls (update may call find_one multiple times)
+        assert patched_user_model.find_one.call_count >= 1
+        mock_user.save.assert_called_once()
 
-            # Verify result
-            assert result is not None
-            assert result.firstName == "John"
-            assert result.lastName == "Doe"
-            assert result.phone == "+9876543210"
+        # Verify result
+        assert result is not None
+        assert result.firstName == "John"
+        assert result.lastName == "Doe"
+        assert result.phone == "+9876543210"
 
-    @pytest.mark.asyncio
-    async def test_update_user_restricted_fields(self, user_service, test_data_factory):
+    async def test_update_user_restricted_fields(
+        self, user_service, patched_user_model, test_data_factory
+    ):
         """Test that isActive and isVerified cannot be updated."""
         # Create test data using factory with valid ObjectId
-        user_id = str(ObjectId())
+        user_id = _STATIC_OID_STR
         existing_user_data = test_data_factory.create_user_data(id=user_id)
 
         # Create a mock user instance
-        mock_user = Mock(spec=User)
-        mock_user.id = ObjectId(existing_user_data["id"])
-        mock_user.email = existing_user_data["email"]
-        mock_user.phone = existing_user_data["phone"]
-        mock_user.password = existing_user_data["password"]
-        mock_user.userType = existing_user_data.get("userType", "user")
-        mock_user.features = existing_user_data.get("features", [])
-        mock_user.isActive = existing_user_data["isActive"]
-        mock_user.isVerified = existing_user_data["isVerified"]
-        mock_user.firstName = existing_user_data.get("firstName")
-        mock_user.lastName = existing_user_data.get("lastName")
-        mock_user.address = existing_user_data.get("address")
-        mock_user.city = existing_user_data.get("city")
-        mock_user.pinCode = existing_user_data.get("pinCode")
-        mock_user.state = existing_user_data.get("state")
-        mock_user.organizationId = existing_user_data.get("organizationId")
-        mock_user.orgName = existing_user_data.get("orgName")
-        mock_user.createdAt = existing_user_data["createdAt"]
-        mock_user.updatedAt = existing_user_data["updatedAt"]
+        mock_user = _make_user_mock(existing_user_data)
         mock_user.save = AsyncMock()
 
         # Try to update restricted fields
@@ -432,123 +392,73 @@ class TestUserService:
             isVerified=True,  # Should be ignored
         )
 
-        with patch("app.services.user_service.User") as mock_user_class:
-            # Setup mock to handle query pattern
-            mock_user_class.id = MagicMock()
-            mock_user_class.id.__eq__ = MagicMock(return_value="query")
-            mock_user_class.find_one = AsyncMock(return_value=mock_user)
+        patched_user_model.find_one.return_value = mock_user
 
-            result = await user_service.update_user(
-                existing_user_data["id"], user_update
-            )
+        result = await user_service.update_user(existing_user_data["id"], user_update)
 
-            # Verify that the update was processed
-            mock_user.save.assert_called_once()
+        # Verify that the update was processed
+        mock_user.save.assert_called_once()
 
-            # Check that restricted fields were not updated
-            assert result.firstName == "John"
-            # isActive and isVerified should remain unchanged
-            # (This would need to be verified in the actual implementation)
+        # Check that restricted fields were not updated
+        assert result.firstName == "John"
+        # isActive and isVerified should remain unchanged
+        # (This would need to be verified in the actual implementation)
 
-    @pytest.mark.asyncio
-    async def test_delete_user_success(self, user_service):
+    async def test_delete_user_success(self, user_service, patched_user_model):
         """Test successful user deletion."""
         mock_user = Mock(spec=User)
-        mock_user.id = ObjectId()
+        mock_user.id = _STATIC_OID
         mock_user.delete = AsyncMock()
 
-        with patch("app.services.user_service.User") as mock_user_class:
-            # Setup mock to handle query pattern
-            mock_user_class.id = MagicMock()
-            mock_user_class.id.__eq__ = MagicMock(return_value="query")
-            mock_user_class.find_one = AsyncMock(return_value=mock_user)
+        patched_user_model.find_one.return_value = mock_user
 
-            result = await user_service.delete_user(str(mock_user.id))
+        result = await user_service.delete_user(str(mock_user.id))
 
-            # Verify Beanie calls
-            mock_user_class.find_one.assert_called_once()
-            mock_user.delete.assert_called_once()
+        # Verify Beanie calls
+        patched_user_model.find_one.assert_called_once()
+        mock_user.delete.assert_called_once()
 
-            # Verify result
-            assert result is True
+        # Verify result
+        assert result is True
 
-    @pytest.mark.asyncio
-    async def test_delete_user_not_found(self, user_service):
+    async def test_delete_user_not_found(self, user_service, patched_user_model):
         """Test user deletion with non-existent ID."""
-        with patch("app.services.user_service.User") as mock_user_class:
-            # Setup mock to handle query pattern
-            mock_user_class.id = MagicMock()
-            mock_user_class.id.__eq__ = MagicMock(return_value="query")
-            mock_user_class.find_one = AsyncMock(return_value=None)
+        patched_user_model.find_one.return_value = None
 
-            result = await user_service.delete_user("507f1f77bcf86cd799439011")
+        result = await user_service.delete_user(_STATIC_OID_STR)
 
-            # Verify Beanie call
-            mock_user_class.find_one.assert_called_once()
+        # Verify Beanie call
+        patched_user_model.find_one.assert_called_once()
 
-            # Verify result
-            assert result is False
+        # Verify result
+        assert result is False
 
-    @pytest.mark.asyncio
     async def test_list_users_with_pagination(self, user_service, test_data_factory):
         """Test user listing with pagination."""
         # Create test data using factory with valid ObjectIds
         mock_users_data = [
             test_data_factory.create_user_data(
-                id=str(ObjectId()),
+                id=_STATIC_OID_STR,
                 email="user1@example.com",
                 phone="+1234567890",
             ),
             test_data_factory.create_user_data(
-                id=str(ObjectId()),
+                id=_STATIC_OID_2_STR,
                 email="user2@example.com",
                 phone="+9876543210",
             ),
         ]
 
-        # Create mock user instances
-        mock_user1 = MagicMock()
-        mock_user1.id = ObjectId(mock_users_data[0]["id"])
-        mock_user1.email = mock_users_data[0]["email"]
-        mock_user1.phone = mock_users_data[0]["phone"]
-        mock_user1.password = mock_users_data[0]["password"]
-        mock_user1.userType = mock_users_data[0].get("userType", "user")
-        mock_user1.features = mock_users_data[0].get("features", [])
-        mock_user1.isActive = mock_users_data[0]["isActive"]
-        mock_user1.isVerified = mock_users_data[0]["isVerified"]
-        mock_user1.firstName = mock_users_data[0].get("firstName")
-        mock_user1.lastName = mock_users_data[0].get("lastName")
-        mock_user1.address = mock_users_data[0].get("address")
-        mock_user1.city = mock_users_data[0].get("city")
-        mock_user1.pinCode = mock_users_data[0].get("pinCode")
-        mock_user1.state = mock_users_data[0].get("state")
-        mock_user1.organizationId = mock_users_data[0].get("organizationId")
-        mock_user1.orgName = mock_users_data[0].get("orgName")
-        mock_user1.createdAt = mock_users_data[0]["createdAt"]
-        mock_user1.updatedAt = mock_users_data[0]["updatedAt"]
-
-        mock_user2 = MagicMock()
-        mock_user2.id = ObjectId(mock_users_data[1]["id"])
-        mock_user2.email = mock_users_data[1]["email"]
-        mock_user2.phone = mock_users_data[1]["phone"]
-        mock_user2.password = mock_users_data[1]["password"]
-        mock_user2.userType = mock_users_data[1].get("userType", "user")
-        mock_user2.features = mock_users_data[1].get("features", [])
-        mock_user2.isActive = mock_users_data[1]["isActive"]
-        mock_user2.isVerified = mock_users_data[1]["isVerified"]
-        mock_user2.firstName = mock_users_data[1].get("firstName")
-        mock_user2.lastName = mock_users_data[1].get("lastName")
-        mock_user2.address = mock_users_data[1].get("address")
-        mock_user2.city = mock_users_data[1].get("city")
-        mock_user2.pinCode = mock_users_data[1].get("pinCode")
-        mock_user2.state = mock_users_data[1].get("state")
-        mock_user2.organizationId = mock_users_data[1].get("organizationId")
-        mock_user2.orgName = mock_users_data[1].get("orgName")
-        mock_user2.createdAt = mock_users_data[1]["createdAt"]
-        mock_user2.updatedAt = mock_users_data[1]["updatedAt"]
+        # list_users only reads attributes, so plain namespaces are enough
+        mock_user1, mock_user2 = (
+            SimpleNamespace(
+                id=ObjectId(d["id"]), **{attr: d.get(attr) for attr in _USER_ATTRS}
+            )
+            for d in mock_users_data
+        )
 
         # Mock find operation
-        mock_cursor = MagicMock()
+        mock_cursor = Mock()
         mock_cursor.skip.return_value = mock_cursor
         mock_cursor.limit.return_value = mock_cursor
         mock_cursor.to_list = AsyncMock(return_value=[mock_user1, mock_user2])
@@ -561,7 +471,6 @@ class TestUserService:
             assert result[0].email == "user1@example.com"
             assert result[1].email == "user2@example.com"
 
-    @pytest.mark.asyncio
     async def test_count_users(self, user_service):
         """Test user counting."""
         with patch("app.models.user.User.count", new_callable=AsyncMock) as mock_count:
@@ -579,41 +488,45 @@ class TestUserService:
 class TestUserAPIEndpoints:
     """Test user API endpoints."""
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def baseline_user_indb(cls):
+        """Validate one UserInDB for the class; tests vary it with model_copy."""
+        return UserInDB(**TestDataFactory.create_user_data(id=_STATIC_OID_STR))
+
     @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
+    def auth_as(self, override):
+        """Authenticate requests as the given user for the current test."""
+
+        def _apply(user_id: str, email: str):
+            mock_token_data = TokenData(
+                user_id=user_id,
+                email=email,
+                token_type="access",
+                expires_at=_STATIC_NOW,
+            )
+            override(get_current_user_token, lambda: mock_token_data)
+            return mock_token_data
+
+        return _apply
 
     @pytest.fixture
-    def test_data_factory(self):
-        """Test data factory fixture."""
-        from tests.conftest import TestDataFactory
-
-        return TestDataFactory()
-
-    def _mock_auth_dependency(self, user_id: str, email: str):
-        """Helper to mock authentication dependency."""
-        mock_token_data = TokenData(
-            user_id=user_id,
-            email=email,
-            token_type="access",
-            expires_at=datetime.now(UTC),
-        )
-        app.dependency_overrides[get_current_user_token] = lambda: mock_token_data
-        return mock_token_data
+    def mock_service(self):
+        """Patch the UserService class used by the user endpoints."""
+        with patch("app.api.endpoints.user.UserService") as mock_service_class:
+            yield mock_service_class
 
-    def test_create_user_success(self, client, test_data_factory):
+    def test_create_user_success(self, mock_service, client, test_data_factory):
         """Test successful user creation via API."""
-        # Create test data using factory
-        user_create_data = test_data_factory.create_user_create_request()
+        user_create_data = _VALID_CREATE
+        # Create the stored user using factory
         user_in_db_data = test_data_factory.create_user_data(
-            id=str(ObjectId()),
+            id=_STATIC_OID_STR,
             email=user_create_data["email"],
             phone=user_create_data["phone"],
         )
 
         with (
-            patch("app.api.endpoints.user.UserService") as mock_service,
             patch("app.api.endpoints.user.generate_otp", return_value="123456"),
             patch(
                 "app.api.endpoints.user.store_otp",
@@ -626,11 +539,13 @@ class TestUserAPIEndpoints:
                 return_value=True,
             ),
         ):
-            mock_service.return_value.create_user = AsyncMock(
-                return_value=UserInDB(**user_in_db_data)
+            mock_service.return_value.create_user = areturn(
+                UserInDB.model_construct(**user_in_db_data)
             )
 
-            response = client.post("/api/user/", json=user_create_data)
+            response = client.post(
+                "/api/user/", content=_VALID_CREATE_BODY, headers=_JSON_HEADERS
+            )
 
             assert response.status_code == 200
             data = response.json()
@@ -644,12 +559,7 @@ class TestUserAPIEndpoints:
         """Test user creation with validation errors."""
         # Test with invalid email
         response = client.post(
-            "/api/user/",
-            json={
-                "email": "invalid-email",
-                "phone": "+1234567890",
-                "password": "password123",
-            },
+            "/api/user/", content=_INVALID_EMAIL_CREATE_BODY, headers=_JSON_HEADERS
         )
 
         assert response.status_code == 422
@@ -658,311 +568,250 @@ class TestUserAPIEndpoints:
         assert data["error_code"] == "VALIDATION_ERROR"
         assert "validation_errors" in data
 
-    def test_create_user_email_conflict(self, client, test_data_factory):
+    def test_create_user_email_conflict(self, mock_service, client):
         """Test user creation with existing email."""
-        # Create test data using factory
-        user_create_data = test_data_factory.create_user_create_request()
+        user_create_data = _VALID_CREATE
 
-        with patch("app.api.endpoints.user.UserService") as mock_service:
-            mock_service.return_value.create_user = AsyncMock(
-                side_effect=ConflictException(
-                    message="User with this email already exists",
-                    details={"email": user_create_data["email"]},
-                )
+        mock_service.return_value.create_user = araise(
+            ConflictException(
+                message="User with this email already exists",
+                details={"email": user_create_data["email"]},
             )
+        )
 
-            response = client.post("/api/user/", json=user_create_data)
+        response = client.post(
+            "/api/user/", content=_VALID_CREATE_BODY, headers=_JSON_HEADERS
+        )
 
-            assert response.status_code == 409
-            data = response.json()
-            assert data["success"] is False
-            assert "User with this email already exists" in data["message"]
+        assert response.status_code == 409
+        data = response.json()
+        assert data["success"] is False
+        assert "User with this email already exists" in data["message"]
 
-    def test_get_current_user_success(self, client, test_data_factory):
+    def test_get_current_user_success(
+        self, mock_service, client, auth_as, baseline_user_indb
+    ):
         """Test successful current user retrieval."""
-        # Create test data using factory
-        user_data = test_data_factory.create_user_data(id=str(ObjectId()))
+        user_email = baseline_user_indb.email
 
         # Mock authentication
-        self._mock_auth_dependency(str(ObjectId()), user_data["email"])
+        auth_as(_STATIC_OID_STR, user_email)
 
-        try:
-            with patch("app.api.endpoints.user.UserService") as mock_service:
-                mock_service.return_value.get_user_by_id = AsyncMock(
-                    return_value=UserInDB(**user_data)
-                )
+        mock_service.return_value.get_user_by_id = areturn(baseline_user_indb)
 
-                response = client.get("/api/user/me")
+        response = client.get("/api/user/me")
 
-                assert response.status_code == 200
-                data = response.json()
-                assert data["success"] is True
-                assert data["data"]["email"] == user_data["email"]
-        finally:
-            # Clean up the override
-            app.dependency_overrides.clear()
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"]["email"] == user_email
 
-    def test_update_user_success(self, client, test_data_factory):
+    def test_update_user_success(
+        self, mock_service, client, auth_as, test_data_factory, baseline_user_indb
+    ):
         """Test successful user update."""
         # Create test data using factory
-        user_data = test_data_factory.create_user_data(id=str(ObjectId()))
         update_data = test_data_factory.create_user_update_request(
             firstName="John", lastName="Doe", phone="+9876543210"
         )
-        updated_user_data = test_data_factory.create_user_data(
-            id=user_data["id"], firstName="John", lastName="Doe", phone="+9876543210"
+        updated_user = baseline_user_indb.model_copy(
+            update={"firstName": "John", "lastName": "Doe", "phone": "+9876543210"}
         )
 
         # Mock authentication
-        self._mock_auth_dependency(str(ObjectId()), user_data["email"])
-
-        try:
-            with patch("app.api.endpoints.user.UserService") as mock_service:
-                mock_service_instance = mock_service.return_value
-                mock_service_instance.get_user_by_id = AsyncMock(
-                    return_value=UserInDB(**user_data)
-                )
-                mock_service_instance.update_user = AsyncMock(
-                    return_value=UserInDB(**updated_user_data)
-                )
-
-                response = client.put("/api/user/me", json=update_data)
-
-                assert response.status_code == 200
-                data = response.json()
-                assert data["success"] is True
-                assert data["data"]["firstName"] == "John"
-                assert data["data"]["lastName"] == "Doe"
-        finally:
-            # Clean up the override
-            app.dependency_overrides.clear()
-
-    def test_update_user_restricted_fields(self, client, test_data_factory):
+        auth_as(_STATIC_OID_STR, baseline_user_indb.email)
+
+        mock_service_instance = mock_service.return_value
+        mock_service_instance.get_user_by_id = areturn(baseline_user_indb)
+        mock_service_instance.update_user = areturn(updated_user)
+
+        response = client.put("/api/user/me", json=update_data)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"]["firstName"] == "John"
+        assert data["data"]["lastName"] == "Doe"
+
+    def test_update_user_restricted_fields(
+        self, mock_service, client, auth_as, baseline_user_indb
+    ):
         """Test that restricted fields cannot be updated."""
-        # Create test data using factory
-        user_data = test_data_factory.create_user_data(id=str(ObjectId()))
-        updated_user_data = test_data_factory.create_user_data(
-            id=user_data["id"],
-            firstName="John",
-            isActive=True,  # Should remain unchanged
-            isVerified=False,  # Should remain unchanged
+        updated_user = baseline_user_indb.model_copy(
+            update={
+                "firstName": "John",
+                "isActive": True,  # Should remain unchanged
+                "isVerified": False,  # Should remain unchanged
+            }
         )
 
         # Mock authentication
-        self._mock_auth_dependency(str(ObjectId()), user_data["email"])
-
-        try:
-            with patch("app.api.endpoints.user.UserService") as mock_service:
-                # Mock that the service ignores restricted fields
-                mock_service_instance = mock_service.return_value
-                mock_service_instance.get_user_by_id = AsyncMock(
-                    return_value=UserInDB(**user_data)
-                )
-                mock_service_instance.update_user = AsyncMock(
-                    return_value=UserInDB(**updated_user_data)
-                )
-
-                response = client.put(
-                    "/api/user/me",
-                    json={
-                        "firstName": "John",
-                        "isActive": False,  # Should be ignored
-                        "isVerified": True,  # Should be ignored
-                    },
-                )
-
-                assert response.status_code == 200
-                data = response.json()
-                assert data["success"] is True
-                assert data["data"]["firstName"] == "John"
-                # isActive and isVerified should remain unchanged
-        finally:
-            # Clean up the override
-            app.dependency_overrides.clear()
-
-    def test_list_users_success(self, client, test_data_factory):
+        auth_as(_STATIC_OID_STR, baseline_user_indb.email)
+
+        # Mock that the service ignores restricted fields
+        mock_service_instance = mock_service.return_value
+        mock_service_instance.get_user_by_id = areturn(baseline_user_indb)
+        mock_service_instance.update_user = areturn(updated_user)
+
+        response = client.put(
+            "/api/user/me",
+            json={
+                "firstName": "John",
+                "isActive": False,  # Should be ignored
+                "isVerified": True,  # Should be ignored
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"]["firstName"] == "John"
+        # isActive and isVerified should remain unchanged
+
+    def test_list_users_success(
+        self, mock_service, client, auth_as, baseline_user_indb
+    ):
         """Test successful user listing."""
-        # Create test data using factory
-        mock_users_data = [
-            test_data_factory.create_user_data(
-                id=str(ObjectId()),
-                email="user1@example.com",
-                phone="+1234567890",
+        mock_users = [
+            baseline_user_indb.model_copy(
+                update={
+                    "id": _STATIC_OID,
+                    "email": "user1@example.com",
+                    "phone": "+1234567890",
+                }
             ),
-            test_data_factory.create_user_data(
-                id=str(ObjectId()),
-                email="user2@example.com",
-                phone="+9876543210",
+            baseline_user_indb.model_copy(
+                update={
+                    "id": _STATIC_OID_2,
+                    "email": "user2@example.com",
+                    "phone": "+9876543210",
+                }
             ),
         ]
-        mock_users = [UserInDB(**user_data) for user_data in mock_users_data]
 
         # Mock authentication
-        self._mock_auth_dependency(str(ObjectId()), "test@example.com")
-
-        try:
-            with patch("app.api.endpoints.user.UserService") as mock_service:
-                mock_service_instance = mock_service.return_value
-                mock_service_instance.list_users = AsyncMock(return_value=mock_users)
-                mock_service_instance.count_users = AsyncMock(return_value=2)
-
-                response = client.get("/api/user/list?page=1&size=10")
-
-                assert response.status_code == 200
-                data = response.json()
-                assert data["success"] is True
-                assert len(data["data"]) == 2
-                assert "pagination" in data
-        finally:
-            # Clean up the override
-            app.dependency_overrides.clear()
-
-    def test_delete_user_success(self, client):
+        auth_as(_STATIC_OID_STR, "test@example.com")
+
+        mock_service_instance = mock_service.return_value
+        mock_service_instance.list_users = areturn(mock_users)
+        mock_service_instance.count_users = areturn(2)
+
+        response = client.get("/api/user/list?page=1&size=10")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert len(data["data"]) == 2
+        assert "pagination" in data
+
+    def test_delete_user_success(self, mock_service, client, auth_as):
         """Test successful user deletion."""
         # Create valid ObjectId for the test
-        user_id = str(ObjectId())
+        user_id = _STATIC_OID_STR
 
         # Mock authentication
-        self._mock_auth_dependency(user_id, "test@example.com")
+        auth_as(user_id, "test@example.com")
 
-        try:
-            with patch("app.api.endpoints.user.UserService") as mock_service:
-                mock_service_instance = mock_service.return_value
-                mock_service_instance.delete_user = AsyncMock(return_value=True)
+        mock_service_instance = mock_service.return_value
+        mock_service_instance.delete_user = areturn(True)
 
-                response = client.delete(f"/api/user/{user_id}")
+        response = client.delete(f"/api/user/{user_id}")
 
-                assert response.status_code == 200
-                data = response.json()
-                assert data["success"] is True
-                assert "User deleted successfully" in data["message"]
-        finally:
-            # Clean up the override
-            app.dependency_overrides.clear()
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert "User deleted successfully" in data["message"]
 
-    def test_delete_user_not_found(self, client):
+    def test_delete_user_not_found(self, mock_service, client, auth_as):
         """Test user deletion with non-existent ID."""
         # Create valid ObjectId for the test
-        user_id = str(ObjectId())
+        user_id = _STATIC_OID_STR
 
         # Mock authentication
-        self._mock_auth_dependency(user_id, "test@example.com")
+        auth_as(user_id, "test@example.com")
 
-        try:
-            with patch("app.api.endpoints.user.UserService") as mock_service:
-                mock_service_instance = mock_service.return_value
-                mock_service_instance.delete_user = AsyncMock(
-                    side_effect=NotFoundException("User not found")
-                )
+        mock_service_instance = mock_service.return_value
+        mock_service_instance.delete_user = araise(NotFoundException("User not found"))
 
-                response = client.delete(f"/api/user/{user_id}")
+        response = client.delete(f"/api/user/{user_id}")
 
-                assert response.status_code == 404
-                data = response.json()
-                assert data["success"] is False
-                assert "User not found" in data["message"]
-        finally:
-            # Clean up the override
-            app.dependency_overrides.clear()
+        assert response.status_code == 404
+        data = response.json()
+        assert data["success"] is False
+        assert "User not found" in data["message"]
 
 
 class TestDatabaseInteractions:
     """Test database interaction behaviors."""
 
-    def test_user_creation_sets_timestamps(self):
-        """Test that user creation sets createdAt and updatedAt."""
-        with patch("app.models.user.User.get_settings") as mock_get_settings:
-            mock_settings = MagicMock()
-            mock_settings.pymongo_collection = MagicMock()
-            mock_get_settings.return_value = mock_settings
+    @pytest.fixture(scope="class")
+    @classmethod
+    def base_user(cls, patched_user_settings):
+        """Build one User document for the class; tests vary it with model_copy."""
+        return User(
+            email="test@example.com",
+            phone="+1234567890",
+            password="hashed_password",
+        )
 
-            user = User(
-                email="test@example.com",
-                phone="+1234567890",
-                password="hashed_password",
-            )
+    def test_user_creation_sets_timestamps(self, base_user):
+        """Test that user creation sets createdAt and updatedAt."""
+        # A document that has never been saved has no createdAt yet
+        user = base_user.model_copy(update={"createdAt": None})
+        before = datetime.now(UTC)
 
-            # Simulate the before_event hook
-            user.set_timestamps()
+        # Simulate the before_event hook
+        user.set_timestamps()
+        after = datetime.now(UTC)
 
-            assert user.createdAt is not None
-            assert user.updatedAt is not None
-            assert isinstance(user.createdAt, datetime)
-            assert isinstance(user.updatedAt, datetime)
-            assert user.createdAt <= datetime.now(UTC)
-            assert user.updatedAt <= datetime.now(UTC)
+        assert isinstance(user.createdAt, datetime)
+        assert isinstance(user.updatedAt, datetime)
+        assert before <= user.createdAt <= after
+        assert before <= user.updatedAt <= after
 
-    def test_user_update_updates_timestamp(self):
+    def test_user_update_updates_timestamp(self, base_user):
         """Test that user update modifies updatedAt."""
-        with patch("app.models.user.User.get_settings") as mock_get_settings:
-            mock_settings = MagicMock()
-            mock_settings.pymongo_collection = MagicMock()
-            mock_get_settings.return_value = mock_settings
-
-            user = User(
-                email="test@example.com",
-                phone="+1234567890",
-                password="hashed_password",
-                createdAt=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
-                updatedAt=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
-            )
+        fixed_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+        user = base_user.model_copy(
+            update={"createdAt": fixed_time, "updatedAt": fixed_time}
+        )
 
-            original_updated_at = user.updatedAt
+        original_updated_at = user.updatedAt
 
-            # Simulate update
-            user.set_timestamps()
+        # Simulate update
+        user.set_timestamps()
 
-            assert user.updatedAt > original_updated_at
-            assert user.createdAt == datetime(
-                2024, 1, 1, 12, 0, 0, tzinfo=UTC
-            )  # Should not change
+        assert user.updatedAt > original_updated_at
+        assert user.createdAt == fixed_time  # Should not change
 
     def test_user_model_settings(self):
         """Test User model settings."""
         assert User.Settings.name == "users"
 
-    def test_user_email_index(self):
+    def test_user_email_index(self, base_user):
         """Test that email field has proper indexing."""
         # This would need to be tested with actual Beanie integration
         # For now, we can verify the field definition
-        with patch("app.models.user.User.get_settings") as mock_get_settings:
-            mock_settings = MagicMock()
-            mock_settings.pymongo_collection = MagicMock()
-            mock_get_settings.return_value = mock_settings
-
-            user = User(
-                email="test@example.com",
-                phone="+1234567890",
-                password="hashed_password",
-            )
-            assert hasattr(user, "email")
-            assert user.email == "test@example.com"
+        assert hasattr(base_user, "email")
+        assert base_user.email == "test@example.com"
 
 
 class TestUserEdgeCases:
     """Test edge cases and comprehensive error scenarios."""
 
-    @pytest.fixture
-    def test_data_factory(self):
-        """Test data factory fixture."""
-        from tests.conftest import TestDataFactory
-
-        return TestDataFactory()
-
-    def test_phone_number_normalization_edge_cases(self, test_data_factory):
-        """Test phone number normalization with various formats."""
-        # Test various phone number formats
-        test_cases = [
+    @pytest.mark.parametrize(
+        "input_phone, expected_phone",
+        [
             ("+1 (234) 567-890", "+1234567890"),
             ("+91 98765 43210", "+919876543210"),
             ("1234567890", "+1234567890"),
             ("+44 20 7946 0958", "+442079460958"),
             ("+33 1 42 86 83 26", "+33142868326"),
-        ]
-
-        for input_phone, expected_phone in test_cases:
-            result = validate_required_phone_number(input_phone)
-            assert result == expected_phone
+        ],
+    )
+    def test_phone_number_normalization_edge_cases(self, input_phone, expected_phone):
+        """Test phone number normalization with various formats."""
+        assert validate_required_phone_number(input_phone) == expected_phone
 
     def test_phone_number_boundary_conditions(self):
         """Test phone number validation at boundary conditions."""
@@ -985,54 +834,39 @@ class TestUserEdgeCases:
         ):
             validate_required_phone_number("1234567890123456")
 
-    def test_unicode_and_special_characters(self, test_data_factory):
+    def test_unicode_and_special_characters(self):
         """Test handling of unicode and special characters in user data."""
         # Test unicode in names
-        user_data = test_data_factory.create_user_data(
-            firstName="José", lastName="García-López"
+        user_create = UserCreateRequest(
+            **_VALID_CREATE, firstName="José", lastName="García-López"
         )
-        assert user_data["firstName"] == "José"
-        assert user_data["lastName"] == "García-López"
+        assert user_create.firstName == "José"
+        assert user_create.lastName == "García-López"
 
         # Test special characters in email (should be valid)
-        user_data = test_data_factory.create_user_data(email="test+tag@example.com")
-        assert user_data["email"] == "test+tag@example.com"
+        user_create = UserCreateRequest(
+            **{**_VALID_CREATE, "email": "test+tag@example.com"}
+        )
+        assert user_create.email == "test+tag@example.com"
 
     def test_password_validation_edge_cases(self):
         """Test password validation edge cases."""
         # Test minimum length
-        valid_short_password = "12345678"  # 8 characters
         user_create = UserCreateRequest(
-            email="test@example.com",
-            phone="+1234567890",
-            password=valid_short_password,
+            **{**_VALID_CREATE, "password": _SHORT_PASSWORD}
         )
-        assert user_create.password == valid_short_password
+        assert user_create.password == _SHORT_PASSWORD
 
         # Test maximum length
-        valid_long_password = "a" * 100  # 100 characters
-        user_create = UserCreateRequest(
-            email="test@example.com",
-            phone="+1234567890",
-            password=valid_long_password,
-        )
-        assert user_create.password == valid_long_password
+        user_create = UserCreateRequest(**{**_VALID_CREATE, "password": _LONG_PASSWORD})
+        assert user_create.password == _LONG_PASSWORD
 
         # Test too short password
         with pytest.raises(ValidationError):
-            UserCreateRequest(
-                email="test@example.com",
-                phone="+1234567890",
-                password="short",  # 5 characters
-            )
+            UserCreateRequest(**{**_VALID_CREATE, "password": "short"})
 
     def test_boolean_field_validation(self, test_data_factory):
         """Test boolean field validation edge cases."""
-        # Test userType with various values
-        from pydantic import ValidationError
-
-        from app.models.user import UserType
-
         # Valid userType values (only USER and ORG_USER allowed for self-registration)
         valid_test_cases = [
             (UserType.USER, UserType.USER),
@@ -1044,10 +878,7 @@ class TestUserEdgeCases:
         for input_value, expected_value in valid_test_cases:
             # Use UserCreateRequest to test actual Pydantic validation
             user_create = UserCreateRequest(
-                email="test@example.com",
-                phone="+1234567890",
-                password="password123",
-                userType=input_value,
+                **{**_VALID_CREATE, "userType": input_value}
             )
             assert user_create.userType == expected_value
 
@@ -1055,12 +886,7 @@ class TestUserEdgeCases:
         elevated_roles = [UserType.ADMIN, UserType.ORG_ADMIN, "admin", "org_admin"]
         for elevated_role in elevated_roles:
             with pytest.raises(ValidationError) as exc_info:
-                UserCreateRequest(
-                    email="test@example.com",
-                    phone="+1234567890",
-                    password="password123",
-                    userType=elevated_role,
-                )
+                UserCreateRequest(**{**_VALID_CREATE, "userType": elevated_role})
             # Verify the error message mentions self-assignment restriction
             error_str = str(exc_info.value)
             assert (
@@ -1068,42 +894,36 @@ class TestUserEdgeCases:
                 or "self-assigned" in error_str.lower()
             )
 
-    def test_email_validation_comprehensive(self):
-        """Test comprehensive email validation scenarios."""
-        # Valid email formats
-        valid_emails = [
+    @pytest.mark.parametrize(
+        "email",
+        [
             "test@example.com",
             "user.name@domain.co.uk",
             "test+tag@example.org",
             "user123@subdomain.example.com",
             "a@b.co",
-        ]
-
-        for email in valid_emails:
-            user_create = UserCreateRequest(
-                email=email,
-                phone="+1234567890",
-                password="password123",
-            )
-            assert user_create.email == email
-
-        # Invalid email formats
-        invalid_emails = [
+        ],
+    )
+    def test_email_valid(self, email):
+        """Test that valid email formats are accepted."""
+        user_create = UserCreateRequest(**{**_VALID_CREATE, "email": email})
+        assert user_create.email == email
+
+    @pytest.mark.parametrize(
+        "email",
+        [
             "invalid-email",
             "@example.com",
             "test@",
             "test..test@example.com",
             "test@.com",
             "",
-        ]
-
-        for email in invalid_emails:
-            with pytest.raises(ValidationError):
-                UserCreateRequest(
-                    email=email,
-                    phone="+1234567890",
-                    password="password123",
-                )
+        ],
+    )
+    def test_email_invalid(self, email):
+        """Test that invalid email formats are rejected."""
+        with pytest.raises(ValidationError):
+            UserCreateRequest(**{**_VALID_CREATE, "email": email})
 
     def test_timestamp_precision_and_timezone(self, test_data_factory):
         """Test timestamp precision and timezone handling."""
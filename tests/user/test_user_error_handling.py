@@ -1,36 +1,97 @@
 """Test user error handling and edge cases."""
 
+import json
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from bson import ObjectId
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
+from app.core.auth_dependencies import TokenData, get_current_user_token
+from app.core.config import settings
 from app.core.exceptions import ConflictException, NotFoundException
 from app.main import app
+from app.models.user import UserCreate, UserInDB, UserType, UserUpdate
+from app.schemas.user import UserCreateRequest, UserUpdateRequest
 from app.services.user_service import UserService
+from app.utils.validators import validate_phone_number, validate_required_phone_number
+from tests.conftest import araise, areturn
+
+_USER_ID = "507f1f77bcf86cd799439011"
+
+# Known-good creation fields; tests override only the field under test
+_VALID_CREATE = {
+    "email": "test@example.com",
+    "phone": "+1234567890",
+    "password": "password123",
+}
+
+# Request bodies encoded once, sent with content= instead of json=
+_JSON_HEADERS = {"content-type": "application/json"}
+_VALID_CREATE_BODY = json.dumps(_VALID_CREATE).encode()
+_INVALID_CREATE_BODY = json.dumps(
+    {"email": "invalid-email", "phone": "", "password": "short"}
+).encode()
+
+# Token data for the authenticated test user
+_TOKEN_DATA = TokenData(
+    user_id=_USER_ID,
+    email="test@example.com",
+    token_type="access",
+    expires_at=datetime(2100, 1, 1, tzinfo=UTC),  # Static far-future expiry
+)
+
+
+@pytest.fixture
+def authenticated(override):
+    """Authenticate requests as the test user by overriding the token dependency."""
+    override(get_current_user_token, lambda: _TOKEN_DATA)
+
+
+@pytest.fixture
+def stub_user_service(monkeypatch):
+    """Make the user endpoints build a namespace of the given async stubs."""
+
+    def _install(**methods):
+        service = SimpleNamespace(**methods)
+        monkeypatch.setattr(
+            "app.api.endpoints.user.UserService", lambda *args, **kwargs: service
+        )
+        return service
+
+    return _install
 
 
 class TestUserAPIErrorHandling:
     """Test user API error handling."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_create_user_validation_error_response(self, client):
-        """Test validation error response format."""
-        response = client.post(
+    @pytest.fixture(scope="class")
+    @classmethod
+    def lenient_client(cls):
+        """Client that returns 500 responses instead of re-raising app errors."""
+        return TestClient(app, raise_server_exceptions=False)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    async def invalid_create_response(cls, aclient):
+        """POST one invalid creation body and share its 422 response.
+
+        Validation fails before any dependency runs, so per-test overrides
+        cannot change this response.
+        """
+        return await aclient.post(
             "/api/user/",
-            json={
-                "email": "invalid-email",
-                "phone": "",
-                "password": "short",
-            },
+            content=_INVALID_CREATE_BODY,
+            headers=_JSON_HEADERS,
         )
 
+    def test_create_user_validation_error_response(self, invalid_create_response):
+        """Test validation error response format."""
+        response = invalid_create_response
+
         assert response.status_code == 422
         data = response.json()
 
@@ -51,140 +112,80 @@ class TestUserAPIErrorHandling:
             for error in validation_errors
         )
 
-    def test_create_user_email_conflict_error(self, client):
+    def test_create_user_email_conflict_error(self, client, stub_user_service):
         """Test email conflict error response."""
-        with patch("app.api.endpoints.user.UserService") as mock_service:
-            mock_service.return_value.create_user = AsyncMock(
-                side_effect=ConflictException(
+        stub_user_service(
+            create_user=araise(
+                ConflictException(
                     message="User with this email already exists",
                     details={"email": "test@example.com"},
                 )
             )
+        )
 
-            response = client.post(
-                "/api/user/",
-                json={
-                    "email": "test@example.com",
-                    "phone": "+1234567890",
-                    "password": "password123",
-                },
-            )
+        response = client.post(
+            "/api/user/",
+            content=_VALID_CREATE_BODY,
+            headers=_JSON_HEADERS,
+        )
 
-            assert response.status_code == 409
-            data = response.json()
+        assert response.status_code == 409
+        data = response.json()
 
-            # Verify error response structure
-            assert data["success"] is False
-            assert data["error_code"] == "CONFLICT"
-            assert "User with this email already exists" in data["message"]
-            assert data["details"]["email"] == "test@example.com"
+        # Verify error response structure
+        assert data["success"] is False
+        assert data["error_code"] == "CONFLICT"
+        assert "User with this email already exists" in data["message"]
+        assert data["details"]["email"] == "test@example.com"
 
-    def test_get_user_not_found_error(self, client):
+    def test_get_user_not_found_error(self, client, authenticated, stub_user_service):
         """Test user not found error response."""
-        with (
-            patch(
-                "app.core.auth_dependencies.verify_access_token"
-            ) as mock_verify_token,
-            patch(
-                "app.core.auth_dependencies.verify_token_not_blocked"
-            ) as mock_verify_not_blocked,
-            patch("app.api.endpoints.user.UserService") as mock_service,
-        ):
-            # Mock JWT verification to return valid token data
-            mock_verify_token.return_value = {
-                "sub": "507f1f77bcf86cd799439011",
-                "email": "test@example.com",
-                "type": "access",
-                "exp": int(datetime.now(UTC).timestamp()) + 3600,
-            }
-            mock_verify_not_blocked.return_value = True
-
-            mock_service.return_value.get_user_by_id = AsyncMock(return_value=None)
-
-            response = client.get(
-                "/api/user/me", headers={"Authorization": "Bearer test_token"}
-            )
+        stub_user_service(get_user_by_id=areturn(None))
 
-            assert response.status_code == 404
-            data = response.json()
+        response = client.get("/api/user/me")
+
+        assert response.status_code == 404
+        data = response.json()
 
-            # Verify error response structure
-            assert data["success"] is False
-            assert data["error_code"] == "NOT_FOUND"
-            assert "User not found" in data["message"]
+        # Verify error response structure
+        assert data["success"] is False
+        assert data["error_code"] == "NOT_FOUND"
+        assert "User not found" in data["message"]
 
-    def test_update_user_not_found_error(self, client):
+    def test_update_user_not_found_error(
+        self, client, authenticated, stub_user_service
+    ):
         """Test user update not found error response."""
-        with (
-            patch(
-                "app.core.auth_dependencies.verify_access_token"
-            ) as mock_verify_token,
-            patch(
-                "app.core.auth_dependencies.verify_token_not_blocked"
-            ) as mock_verify_not_blocked,
-            patch("app.api.endpoints.user.UserService") as mock_service,
-        ):
-            # Mock JWT verification to return valid token data
-            mock_verify_token.return_value = {
-                "sub": "507f1f77bcf86cd799439011",
-                "email": "test@example.com",
-                "type": "access",
-                "exp": int(datetime.now(UTC).timestamp()) + 3600,
-            }
-            mock_verify_not_blocked.return_value = True
-
-            mock_service.return_value.get_user_by_id = AsyncMock(return_value=None)
-
-            response = client.put(
-                "/api/user/me",
-                json={"firstName": "John"},
-                headers={"Authorization": "Bearer test_token"},
-            )
+        stub_user_service(get_user_by_id=areturn(None))
+
+        response = client.put(
+            "/api/user/me",
+            json={"firstName": "John"},
+        )
 
-            assert response.status_code == 404
-            data = response.json()
+        assert response.status_code == 404
+        data = response.json()
 
-            # Verify error response structure
-            assert data["success"] is False
-            assert data["error_code"] == "NOT_FOUND"
-            assert "User not found" in data["message"]
+        # Verify error response structure
+        assert data["success"] is False
+        assert data["error_code"] == "NOT_FOUND"
+        assert "User not found" in data["message"]
 
-    def test_delete_user_not_found_error(self, client):
+    def test_delete_user_not_found_error(
+        self, client, authenticated, stub_user_service
+    ):
         """Test user deletion not found error response."""
-        with (
-            patch(
-                "app.core.auth_dependencies.verify_access_token"
-            ) as mock_verify_token,
-            patch(
-                "app.core.auth_dependencies.verify_token_not_blocked"
-            ) as mock_verify_not_blocked,
-            patch("app.api.endpoints.user.UserService") as mock_service,
-        ):
-            # Mock JWT verification to return valid token data
-            mock_verify_token.return_value = {
-                "sub": "507f1f77bcf86cd799439011",
-                "email": "test@example.com",
-                "type": "access",
-                "exp": int(datetime.now(UTC).timestamp()) + 3600,
-            }
-            mock_verify_not_blocked.return_value = True
-
-            mock_service.return_value.delete_user = AsyncMock(
-                side_effect=NotFoundException("User not found")
-            )
+        stub_user_service(delete_user=araise(NotFoundException("User not found")))
 
-            response = client.delete(
-                "/api/user/507f1f77bcf86cd799439011",
-                headers={"Authorization": "Bearer test_token"},
-            )
+        response = client.delete(f"/api/user/{_USER_ID}")
 
-            assert response.status_code == 404
-            data = response.json()
+        assert response.status_code == 404
+        data = response.json()
 
-            # Verify error response structure
-            assert data["success"] is False
-            assert data["error_code"] == "NOT_FOUND"
-            assert "User not found" in data["message"]
+        # Verify error response structure
+        assert data["success"] is False
+        assert data["error_code"] == "NOT_FOUND"
+        assert "User not found" in data["message"]
 
     # def test_unauthorized_error(self, client):
     #     """Test unauthorized error response."""
@@ -201,35 +202,23 @@ class TestUserAPIErrorHandling:
     #         assert data["error_code"] == "UNAUTHORIZED"
     #         assert "Authentication required" in data["message"]
 
-    def test_internal_server_error(self, client):
+    def test_internal_server_error(self, lenient_client, stub_user_service):
         """Test internal server error response."""
-        with patch("app.api.endpoints.user.UserService") as mock_service:
-            mock_service.return_value.create_user = AsyncMock(
-                side_effect=Exception("Unexpected error")
-            )
-
-            # Use pytest.raises to catch the exception that will be raised
-            with pytest.raises(Exception, match="Unexpected error"):
-                client.post(
-                    "/api/user/",
-                    json={
-                        "email": "test@example.com",
-                        "phone": "+1234567890",
-                        "password": "password123",
-                    },
-                )
+        stub_user_service(create_user=araise(Exception("Unexpected error")))
 
-    def test_validation_error_field_mapping(self, client):
-        """Test that validation errors are properly mapped to fields."""
-        response = client.post(
+        response = lenient_client.post(
             "/api/user/",
-            json={
-                "email": "invalid-email",
-                "phone": "",
-                "password": "short",
-            },
+            content=_VALID_CREATE_BODY,
+            headers=_JSON_HEADERS,
         )
 
+        assert response.status_code == 500
+        assert response.json()["error_code"] == "INTERNAL_SERVER_ERROR"
+
+    def test_validation_error_field_mapping(self, invalid_create_response):
+        """Test that validation errors are properly mapped to fields."""
+        response = invalid_create_response
+
         assert response.status_code == 422
         data = response.json()
 
@@ -242,16 +231,9 @@ class TestUserAPIErrorHandling:
         assert "body.password" in field_names
         # verifyByGovId field no longer exists
 
-    def test_validation_error_message_clarity(self, client):
+    def test_validation_error_message_clarity(self, invalid_create_response):
         """Test that validation error messages are clear and helpful."""
-        response = client.post(
-            "/api/user/",
-            json={
-                "email": "invalid-email",
-                "phone": "",
-                "password": "short",
-            },
-        )
+        response = invalid_create_response
 
         assert response.status_code == 422
         data = response.json()
@@ -266,16 +248,9 @@ class TestUserAPIErrorHandling:
         )
         # Boolean validation no longer needed for verifyByGovId
 
-    def test_error_response_timestamp_format(self, client):
+    def test_error_response_timestamp_format(self, invalid_create_response):
         """Test that error response timestamps are properly formatted."""
-        response = client.post(
-            "/api/user/",
-            json={
-                "email": "invalid-email",
-                "phone": "",
-                "password": "short",
-            },
-        )
+        response = invalid_create_response
 
         assert response.status_code == 422
         data = response.json()
@@ -287,16 +262,9 @@ class TestUserAPIErrorHandling:
         assert timestamp.endswith("Z")  # Should be in UTC format
         assert "T" in timestamp  # Should be in ISO format
 
-    def test_error_response_data_field(self, client):
+    def test_error_response_data_field(self, invalid_create_response):
         """Test that error responses have data field set to null."""
-        response = client.post(
-            "/api/user/",
-            json={
-                "email": "invalid-email",
-                "phone": "",
-                "password": "short",
-            },
-        )
+        response = invalid_create_response
 
         assert response.status_code == 422
         data = response.json()
@@ -304,13 +272,11 @@ class TestUserAPIErrorHandling:
         # Verify data field is null for errors
         assert data["data"] is None
 
-    def test_success_response_data_field(self, client):
+    def test_success_response_data_field(self, client, stub_user_service, monkeypatch):
         """Test that success responses have data field populated."""
-        with patch("app.api.endpoints.user.UserService") as mock_service:
-            from app.models.user import UserInDB, UserType
-
-            mock_service.return_value.create_user = AsyncMock(
-                return_value=UserInDB(
+        stub_user_service(
+            create_user=areturn(
+                UserInDB(
                     id=ObjectId(),
                     email="test@example.com",
                     phone="+1234567890",
@@ -323,262 +289,177 @@ class TestUserAPIErrorHandling:
                     updatedAt=datetime.now(UTC),
                 )
             )
+        )
+        monkeypatch.setattr("app.api.endpoints.user.generate_otp", lambda: "123456")
+        monkeypatch.setattr("app.api.endpoints.user.store_otp", areturn(True))
+        monkeypatch.setattr("app.api.endpoints.user.send_otp_email", areturn(True))
 
-            with (
-                patch("app.api.endpoints.user.generate_otp", return_value="123456"),
-                patch(
-                    "app.api.endpoints.user.store_otp",
-                    new_callable=AsyncMock,
-                    return_value=True,
-                ),
-                patch(
-                    "app.api.endpoints.user.send_otp_email",
-                    new_callable=AsyncMock,
-                    return_value=True,
-                ),
-            ):
-                response = client.post(
-                    "/api/user/",
-                    json={
-                        "email": "test@example.com",
-                        "phone": "+1234567890",
-                        "password": "password123",
-                    },
-                )
+        response = client.post(
+            "/api/user/",
+            content=_VALID_CREATE_BODY,
+            headers=_JSON_HEADERS,
+        )
 
-            assert response.status_code == 200
-            data = response.json()
+        assert response.status_code == 200
+        data = response.json()
 
-            # Verify data field is populated for success
-            assert data["data"] is not None
-            assert data["data"]["email"] == "test@example.com"
+        # Verify data field is populated for success
+        assert data["data"] is not None
+        assert data["data"]["email"] == "test@example.com"
 
 
 class TestUserServiceErrorHandling:
     """Test user service error handling."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Mock database for testing."""
-        db = MagicMock()
-        db.users = MagicMock()
-        db.users.find_one = AsyncMock()
-        db.users.insert_one = AsyncMock()
-        db.users.update_one = AsyncMock()
-        db.users.delete_one = AsyncMock()
-        db.users.count_documents = AsyncMock()
-        return db
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_db(cls):
+        """Mock database for testing, keyed like the real one by collection name.
+
+        UserService goes through the Beanie User model, so the collection has no
+        methods to stub.
+        """
+        return {settings.MONGODB_COLLECTION_USERS: SimpleNamespace()}
 
     @pytest.fixture
     def user_service(self, mock_db):
         """Create UserService instance with mocked database."""
         return UserService(mock_db)
 
-    @pytest.mark.asyncio
-    async def test_create_user_database_error(self, user_service):
-        """Test user creation with database error."""
-        # Mock Beanie User model
-        with patch("app.services.user_service.User") as mock_user_class:
-            mock_user_class.find_one = AsyncMock(return_value=None)
-            mock_user_class.return_value.insert = AsyncMock(
-                side_effect=Exception("Database connection failed")
-            )
-
-            from app.models.user import UserCreate
-
-            user_create = UserCreate(
-                email="test@example.com",
-                phone="+1234567890",
-                password="password123",
-            )
-
-            with pytest.raises(Exception, match="Database connection failed"):
-                await user_service.create_user(user_create)
-
-    @pytest.mark.asyncio
-    async def test_get_user_database_error(self, user_service):
-        """Test user retrieval with database error."""
-        # Mock Beanie User model
-        with patch("app.services.user_service.User") as mock_user_class:
-            mock_user_class.find_one = AsyncMock(
-                side_effect=Exception("Database connection failed")
-            )
-
-            with pytest.raises(Exception, match="Database connection failed"):
-                await user_service.get_user_by_id("507f1f77bcf86cd799439011")
-
-    @pytest.mark.asyncio
-    async def test_update_user_database_error(self, user_service):
-        """Test user update with database error."""
-        # Mock Beanie User model
-        with patch("app.services.user_service.User") as mock_user_class:
-            mock_user = MagicMock()
-            mock_user.id = ObjectId()
-            mock_user.save = AsyncMock(
-                side_effect=Exception("Database connection failed")
-            )
-            mock_user_class.find_one = AsyncMock(return_value=mock_user)
-
-            from app.models.user import UserUpdate
-
-            user_update = UserUpdate(firstName="John")
-
-            with pytest.raises(Exception, match="Database connection failed"):
-                await user_service.update_user("507f1f77bcf86cd799439011", user_update)
-
-    @pytest.mark.asyncio
-    async def test_delete_user_database_error(self, user_service):
-        """Test user deletion with database error."""
-        # Mock Beanie User model
-        with patch("app.services.user_service.User") as mock_user_class:
-            mock_user = MagicMock()
-            mock_user.id = ObjectId()
-            mock_user.delete = AsyncMock(
-                side_effect=Exception("Database connection failed")
-            )
-            mock_user_class.find_one = AsyncMock(return_value=mock_user)
-
-            with pytest.raises(Exception, match="Database connection failed"):
-                await user_service.delete_user("507f1f77bcf86cd799439011")
-
-    @pytest.mark.asyncio
-    async def test_list_users_database_error(self, user_service):
-        """Test user listing with database error."""
-        # Mock Beanie User model
-        with patch("app.services.user_service.User") as mock_user_class:
-            mock_user_class.find = MagicMock()
-            mock_user_class.find.return_value.skip.return_value.limit.return_value.to_list = AsyncMock(
-                side_effect=Exception("Database connection failed")
-            )
-
-            with pytest.raises(Exception, match="Database connection failed"):
-                await user_service.list_users(skip=0, limit=10)
-
-    @pytest.mark.asyncio
-    async def test_count_users_database_error(self, user_service):
-        """Test user counting with database error."""
-        # Mock Beanie User model
-        with patch("app.services.user_service.User") as mock_user_class:
-            mock_user_class.count = AsyncMock(
-                side_effect=Exception("Database connection failed")
-            )
-
-            with pytest.raises(Exception, match="Database connection failed"):
-                await user_service.count_users()
+    @pytest.mark.parametrize(
+        "method, args, user_model_config",
+        [
+            (
+                "create_user",
+                (
+                    UserCreate(
+                        email="test@example.com",
+                        phone="+1234567890",
+                        password="password123",
+                    ),
+                ),
+                lambda error: {
+                    "find_one": AsyncMock(return_value=None),
+                    "return_value.insert": error,
+                },
+            ),
+            (
+                "get_user_by_id",
+                (_USER_ID,),
+                lambda error: {"find_one": error},
+            ),
+            (
+                "update_user",
+                (_USER_ID, UserUpdate(firstName="John")),
+                lambda error: {
+                    "find_one": AsyncMock(
+                        return_value=MagicMock(id=ObjectId(), save=error)
+                    )
+                },
+            ),
+            (
+                "delete_user",
+                (_USER_ID,),
+                lambda error: {
+                    "find_one": AsyncMock(
+                        return_value=MagicMock(id=ObjectId(), delete=error)
+                    )
+                },
+            ),
+            (
+                "list_users",
+                (0, 10),
+                lambda error: {
+                    "find.return_value.skip.return_value.limit.return_value.to_list": error
+                },
+            ),
+            (
+                "count_users",
+                (),
+                lambda error: {"count": error},
+            ),
+        ],
+        ids=["create", "get", "update", "delete", "list", "count"],
+    )
+    async def test_database_error_propagates(
+        self, user_service, patched_user_model, method, args, user_model_config
+    ):
+        """Test that a database error propagates out of each service method."""
+        error = AsyncMock(side_effect=Exception("Database connection failed"))
+        patched_user_model.configure_mock(**user_model_config(error))
+
+        with pytest.raises(Exception, match="Database connection failed"):
+            await getattr(user_service, method)(*args)
 
 
 class TestUserValidationErrorHandling:
     """Test user validation error handling."""
 
-    def test_phone_validation_error_messages(self):
+    @pytest.mark.parametrize(
+        "validator, phone, message",
+        [
+            # Required phone validation errors
+            (validate_required_phone_number, None, "Phone number is required"),
+            (validate_required_phone_number, "", "Phone number cannot be empty"),
+            (
+                validate_required_phone_number,
+                "123",
+                "Phone number must be between 7 and 15 digits",
+            ),
+            # Optional phone validation errors
+            (validate_phone_number, "", "Phone number cannot be empty"),
+        ],
+    )
+    def test_phone_validation_error_messages(self, validator, phone, message):
         """Test phone validation error messages."""
-        from app.utils.validators import (
-            validate_phone_number,
-            validate_required_phone_number,
-        )
-
-        # Test required phone validation errors
-        with pytest.raises(ValueError, match="Phone number is required"):
-            validate_required_phone_number(None)
-
-        with pytest.raises(ValueError, match="Phone number cannot be empty"):
-            validate_required_phone_number("")
-
-        with pytest.raises(
-            ValueError, match="Phone number must be between 7 and 15 digits"
-        ):
-            validate_required_phone_number("123")
-
-        # Test optional phone validation errors
-        with pytest.raises(ValueError, match="Phone number cannot be empty"):
-            validate_phone_number("")
+        with pytest.raises(ValueError, match=message):
+            validator(phone)
 
     def test_email_validation_error_messages(self):
         """Test email validation error messages."""
-        from app.schemas.user import UserCreateRequest
-
-        with pytest.raises(ValueError) as exc_info:
-            UserCreateRequest(
-                email="invalid-email",
-                phone="+1234567890",
-                password="password123",
-            )
 
-        # Verify that email validation error is raised
-        assert "email" in str(exc_info.value)
+        # The validation error names the email field
+        with pytest.raises(ValueError, match="email"):
+            UserCreateRequest(**{**_VALID_CREATE, "email": "invalid-email"})
 
     def test_password_validation_error_messages(self):
         """Test password validation error messages."""
-        from app.schemas.user import UserCreateRequest
 
-        with pytest.raises(ValueError) as exc_info:
-            UserCreateRequest(
-                email="test@example.com",
-                phone="+1234567890",
-                password="short",
-            )
-
-        # Verify that password validation error is raised
-        assert "password" in str(exc_info.value)
+        # The validation error names the password field
+        with pytest.raises(ValueError, match="password"):
+            UserCreateRequest(**{**_VALID_CREATE, "password": "short"})
 
     def test_boolean_validation_error_messages(self):
         """Test boolean validation error messages."""
         # verifyByGovId field no longer exists, so this test is no longer applicable
         # Instead, test userType validation
-        from app.models.user import UserType
-        from app.schemas.user import UserCreateRequest
 
         # Valid userType
-        request = UserCreateRequest(
-            email="test@example.com",
-            phone="+1234567890",
-            password="password123",
-            userType=UserType.USER,
-        )
+        request = UserCreateRequest(**{**_VALID_CREATE, "userType": UserType.USER})
         assert request.userType == UserType.USER
 
 
 class TestUserEdgeCases:
     """Test user edge cases and boundary conditions."""
 
-    def test_very_long_email(self):
-        """Test very long email handling."""
-        from app.schemas.user import UserCreateRequest
-
-        # Very long email (should be handled by email validator)
-        long_email = "a" * 1000 + "@example.com"
-
-        with pytest.raises(ValueError):
-            UserCreateRequest(
-                email=long_email,
-                phone="+1234567890",
-                password="password123",
-            )
-
-    def test_very_long_password(self):
-        """Test very long password handling."""
-        from app.schemas.user import UserCreateRequest
-
-        # Very long password (should be rejected by length validation)
-        long_password = "a" * 101
-
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            ("email", "a" * 1000 + "@example.com"),  # Rejected by email validator
+            ("password", "a" * 101),  # Rejected by length validation
+        ],
+        ids=["very_long_email", "very_long_password"],
+    )
+    def test_overlong_field_rejected(self, field, value):
+        """Test that overlong email and password values are rejected."""
         with pytest.raises(ValueError):
-            UserCreateRequest(
-                email="test@example.com",
-                phone="+1234567890",
-                password=long_password,
-            )
+            UserCreateRequest(**{**_VALID_CREATE, field: value})
 
     def test_unicode_characters_in_fields(self):
         """Test unicode characters in various fields."""
-        from app.schemas.user import UserCreateRequest, UserUpdateRequest
 
         # Test unicode in user creation
-        request = UserCreateRequest(
-            email="tëst@ëxämplë.com",
-            phone="+1234567890",
-            password="password123",
-        )
+        request = UserCreateRequest(**{**_VALID_CREATE, "email": "tëst@ëxämplë.com"})
         assert request.email == "tëst@ëxämplë.com"
 
         # Test unicode in user update
@@ -588,46 +469,46 @@ class TestUserEdgeCases:
         assert update_request.firstName == "José"
         assert update_request.lastName == "García"
 
-    def test_special_characters_in_phone(self):
-        """Test special characters in phone number."""
-        from app.utils.validators import validate_required_phone_number
-
-        # Test various special characters
-        test_cases = [
+    @pytest.mark.parametrize(
+        "input_phone, expected",
+        [
             ("+1-234-567-890", "+1234567890"),
             ("+1 (234) 567-890", "+1234567890"),
             ("+1.234.567.890", "+1234567890"),
             ("+1 234 567 890", "+1234567890"),
-        ]
-
-        for input_phone, expected in test_cases:
-            assert validate_required_phone_number(input_phone) == expected
-
-    def test_boundary_phone_lengths(self):
+        ],
+    )
+    def test_special_characters_in_phone(self, input_phone, expected):
+        """Test special characters in phone number."""
+        assert validate_required_phone_number(input_phone) == expected
+
+    @pytest.mark.parametrize(
+        "input_phone, expected",
+        [
+            ("1234567", "+1234567"),  # Minimum valid length
+            ("123456789012345", "+123456789012345"),  # Maximum valid length
+        ],
+    )
+    def test_boundary_phone_lengths(self, input_phone, expected):
         """Test boundary phone number lengths."""
-        from app.utils.validators import validate_required_phone_number
-
-        # Test minimum valid length
-        assert validate_required_phone_number("1234567") == "+1234567"
-
-        # Test maximum valid length
-        assert validate_required_phone_number("123456789012345") == "+123456789012345"
-
-        # Test just below minimum
+        assert validate_required_phone_number(input_phone) == expected
+
+    @pytest.mark.parametrize(
+        "input_phone",
+        [
+            "123456",  # Just below minimum
+            "1234567890123456",  # Just above maximum
+        ],
+    )
+    def test_out_of_range_phone_lengths(self, input_phone):
+        """Test phone numbers just outside the valid length range."""
         with pytest.raises(
             ValueError, match="Phone number must be between 7 and 15 digits"
         ):
-            validate_required_phone_number("123456")
-
-        # Test just above maximum
-        with pytest.raises(
-            ValueError, match="Phone number must be between 7 and 15 digits"
-        ):
-            validate_required_phone_number("1234567890123456")
+            validate_required_phone_number(input_phone)
 
     def test_empty_string_vs_none_handling(self):
         """Test proper handling of empty strings vs None."""
-        from app.schemas.user import UserUpdateRequest
 
         # None should be allowed for optional fields
         request = UserUpdateRequest(firstName=None)
@@ -643,10 +524,6 @@ class TestUserEdgeCases:
 
     def test_boolean_edge_cases(self):
         """Test userType field edge cases (replaces boolean field testing)."""
-        from pydantic import ValidationError
-
-        from app.models.user import UserType
-        from app.schemas.user import UserCreateRequest
 
         # Test valid userType values (only USER and ORG_USER allowed for self-registration)
         valid_test_cases = [
@@ -657,24 +534,14 @@ class TestUserEdgeCases:
         ]
 
         for input_value, expected in valid_test_cases:
-            request = UserCreateRequest(
-                email="test@example.com",
-                phone="+1234567890",
-                password="password123",
-                userType=input_value,
-            )
+            request = UserCreateRequest(**{**_VALID_CREATE, "userType": input_value})
             assert request.userType == expected
 
         # Test that elevated roles (ADMIN, ORG_ADMIN) are rejected for self-registration
         elevated_roles = [UserType.ADMIN, UserType.ORG_ADMIN, "admin", "org_admin"]
         for elevated_role in elevated_roles:
             with pytest.raises(ValidationError) as exc_info:
-                UserCreateRequest(
-                    email="test@example.com",
-                    phone="+1234567890",
-                    password="password123",
-                    userType=elevated_role,
-                )
+                UserCreateRequest(**{**_VALID_CREATE, "userType": elevated_role})
             # Verify the error message mentions self-assignment restriction
             error_str = str(exc_info.value)
             assert (
@@ -684,9 +551,4 @@ class TestUserEdgeCases:
 
         # Test invalid userType values (not a valid enum value)
         with pytest.raises(ValidationError):
-            UserCreateRequest(
-                email="test@example.com",
-                phone="+1234567890",
-                password="password123",
-                userType="invalid_type",  # Invalid user type
-            )
+            UserCreateRequest(**{**_VALID_CREATE, "userType": "invalid_type"})